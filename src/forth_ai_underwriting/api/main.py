@@ -8,15 +8,20 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from pydantic import BaseModel, Field
 from typing import Dict, Any, Optional, List
+import functools
 import json
 import uvicorn
 from loguru import logger
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 
 from forth_ai_underwriting.config.settings import settings
 from forth_ai_underwriting.services.validation import ValidationService
 from forth_ai_underwriting.infrastructure.ai_parser import get_ai_parser_service
 from forth_ai_underwriting.services.teams_bot import TeamsBot
+from forth_ai_underwriting.services.llm_service import get_llm_service, close_llm_service
+from forth_ai_underwriting.services.process import shutdown_extraction_pools
+from forth_ai_underwriting.utils.http_client import close_http_client
 from forth_ai_underwriting.core.middleware import (
     RequestLoggingMiddleware,
     SecurityHeadersMiddleware,
@@ -36,6 +41,8 @@ async def lifespan(app: FastAPI):
     get_validation_service()
     get_ai_parser_service()
     get_teams_bot()
+    if settings.llm.preinit:
+        await get_llm_service().warm_up()
     
     logger.info("All services initialized successfully")
     
@@ -43,6 +50,9 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Forth AI Underwriting System")
+    await close_llm_service()
+    await close_http_client()
+    shutdown_extraction_pools()
 
 
 # Initialize FastAPI app with lifespan
@@ -92,6 +102,17 @@ def get_teams_bot() -> TeamsBot:
     return _teams_bot
 
 
+@functools.lru_cache(maxsize=1)
+def _iso_timestamp(second: int) -> str:
+    """ISO timestamp of a whole UTC second; only the latest second is kept."""
+    return datetime.fromtimestamp(second, timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO string, truncated to and cached for one second."""
+    return _iso_timestamp(int(time.time()))
+
+
 # Request/Response models
 class WebhookPayload(BaseModel):
     """Webhook payload from Forth Debt Resolution."""
@@ -128,7 +149,7 @@ async def root():
         data={
             "version": settings.app_version,
             "environment": settings.environment,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _utc_timestamp()
         }
     )
 
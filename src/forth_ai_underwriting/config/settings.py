@@ -180,8 +180,8 @@ class SecuritySettings:
             secret_key=secret_key,
             cors_origins=cors_origins,
             cors_allow_credentials=get_env_var_bool("CORS_ALLOW_CREDENTIALS", True),
-            cors_allow_methods=get_env_var_list("CORS_ALLOW_METHODS", cls.cors_allow_methods),
-            cors_allow_headers=get_env_var_list("CORS_ALLOW_HEADERS", cls.cors_allow_headers),
+            cors_allow_methods=get_env_var_list("CORS_ALLOW_METHODS", ["GET", "POST", "PUT", "DELETE"]),
+            cors_allow_headers=get_env_var_list("CORS_ALLOW_HEADERS", ["*"]),
         )
 
 @dataclass(frozen=True)
@@ -191,6 +191,7 @@ class GeminiSettings:
     model_name: str = "gemini-pro"
     temperature: float = 0.7
     max_output_tokens: int = 1024
+    embedding_model: str = "models/text-embedding-004"
     use_aws_secrets: bool = False
     credentials_path: Optional[str] = None
     
@@ -216,6 +217,7 @@ class GeminiSettings:
                     model_name=get_env_var("GEMINI_MODEL_NAME", "gemini-2.0-flash-001"),
                     temperature=get_env_var_float("GEMINI_TEMPERATURE", 0.0),
                     max_output_tokens=get_env_var_int("GEMINI_MAX_OUTPUT_TOKENS", 1024),
+                    embedding_model=get_env_var("GEMINI_EMBEDDING_MODEL", "models/text-embedding-004"),
                     use_aws_secrets=True,
                     credentials_path=credentials_path,
                 )
@@ -232,6 +234,7 @@ class GeminiSettings:
             model_name=get_env_var("GEMINI_MODEL_NAME", "gemini-2.0-flash-001"),
             temperature=get_env_var_float("GEMINI_TEMPERATURE", 0.0),
             max_output_tokens=get_env_var_int("GEMINI_MAX_OUTPUT_TOKENS", 1024),
+            embedding_model=get_env_var("GEMINI_EMBEDDING_MODEL", "models/text-embedding-004"),
             use_aws_secrets=False,
             credentials_path=None,
         )
@@ -256,12 +259,35 @@ class ForthAPISettings:
             webhook_secret=get_env_var("FORTH_WEBHOOK_SECRET", None),
         )
 
+@dataclass(frozen=True)
+class HTTPClientSettings:
+    """Shared outbound HTTP connection pool settings."""
+    max_connections: int = 200
+    max_keepalive_connections: int = 100
+    keepalive_expiry: float = 30.0
+    timeout: float = 120.0
+    http2: bool = False
+    
+    @classmethod
+    def from_environment(cls) -> "HTTPClientSettings":
+        """Load HTTP client settings from environment."""
+        return cls(
+            max_connections=get_env_var_int("HTTP_MAX_CONNECTIONS", 200),
+            max_keepalive_connections=get_env_var_int("HTTP_MAX_KEEPALIVE_CONNECTIONS", 100),
+            keepalive_expiry=get_env_var_float("HTTP_KEEPALIVE_EXPIRY", 30.0),
+            timeout=get_env_var_float("HTTP_TIMEOUT", 120.0),
+            http2=get_env_var_bool("HTTP2_ENABLED", False),
+        )
+
 @dataclass(frozen=True)
 class LLMSettings:
     """LLM service configuration."""
     provider: str = "gemini"
     fallback_provider: Optional[str] = None
     openai_api_key: Optional[str] = None
+    max_concurrency: int = 16
+    preinit: bool = True
+    health_check_ttl: float = 5.0
     
     @classmethod
     def from_environment(cls) -> "LLMSettings":
@@ -270,6 +296,9 @@ class LLMSettings:
             provider=get_env_var("LLM_PROVIDER", "gemini"),
             fallback_provider=get_env_var("LLM_FALLBACK_PROVIDER", None),
             openai_api_key=get_env_var("OPENAI_API_KEY", None),
+            max_concurrency=get_env_var_int("LLM_MAX_CONCURRENCY", 16),
+            preinit=get_env_var_bool("LLM_PREINIT", True),
+            health_check_ttl=get_env_var_float("LLM_HEALTH_CHECK_TTL", 5.0),
         )
 
 @dataclass(frozen=True)
@@ -279,6 +308,7 @@ class DocumentProcessingSettings:
     max_chunk_size: int = 1000
     enable_ai_parsing: bool = True
     processing_timeout: int = 300
+    extraction_processes: int = 0
     
     @classmethod
     def from_environment(cls) -> "DocumentProcessingSettings":
@@ -288,6 +318,7 @@ class DocumentProcessingSettings:
             max_chunk_size=get_env_var_int("MAX_CHUNK_SIZE", 1000),
             enable_ai_parsing=get_env_var_bool("ENABLE_AI_PARSING", True),
             processing_timeout=get_env_var_int("DOCUMENT_PROCESSING_TIMEOUT", 300),
+            extraction_processes=get_env_var_int("PDF_EXTRACTION_PROCESSES", 0),
         )
 
 @dataclass(frozen=True)
@@ -314,6 +345,12 @@ class CacheSettings:
     enable_caching: bool = True
     redis_url: Optional[str] = None
     cache_ttl: int = 3600
+    llm_cache_size: int = 1024
+    llm_semantic_cache_enabled: bool = False
+    llm_semantic_cache_threshold: float = 0.87
+    llm_cache_persistent: bool = False
+    llm_cache_path: str = ".cache/llm_semantic_cache.sqlite3"
+    document_cache_size: int = 128
     
     @classmethod
     def from_environment(cls) -> "CacheSettings":
@@ -322,6 +359,12 @@ class CacheSettings:
             enable_caching=get_env_var_bool("ENABLE_CACHING", True),
             redis_url=get_env_var("REDIS_URL", None),
             cache_ttl=get_env_var_int("CACHE_TTL", 3600),
+            llm_cache_size=get_env_var_int("LLM_CACHE_SIZE", 1024),
+            llm_semantic_cache_enabled=get_env_var_bool("LLM_SEMANTIC_CACHE_ENABLED", False),
+            llm_semantic_cache_threshold=get_env_var_float("LLM_SEMANTIC_CACHE_THRESHOLD", 0.87),
+            llm_cache_persistent=get_env_var_bool("LLM_CACHE_PERSISTENT", False),
+            llm_cache_path=get_env_var("LLM_CACHE_PATH", ".cache/llm_semantic_cache.sqlite3"),
+            document_cache_size=get_env_var_int("DOCUMENT_CACHE_SIZE", 128),
         )
 
 @dataclass(frozen=True)
@@ -330,6 +373,7 @@ class FeatureFlags:
     enable_audit_logging: bool = True
     metrics_enabled: bool = True
     rate_limit_enabled: bool = True
+    hardship_local_approval: bool = False
     
     @classmethod
     def from_environment(cls) -> "FeatureFlags":
@@ -338,6 +382,7 @@ class FeatureFlags:
             enable_audit_logging=get_env_var_bool("ENABLE_AUDIT_LOGGING", True),
             metrics_enabled=get_env_var_bool("METRICS_ENABLED", True),
             rate_limit_enabled=get_env_var_bool("RATE_LIMIT_ENABLED", True),
+            hardship_local_approval=get_env_var_bool("HARDSHIP_LOCAL_APPROVAL", False),
         )
 
 @dataclass(frozen=True)
@@ -353,12 +398,14 @@ class AppSettings:
     app_host: str = "0.0.0.0"
     app_port: int = 8000
     log_level: str = "INFO"
+    health_check_timeout: float = 2.0
     
     # Component settings
     database: DatabaseSettings = field(default_factory=DatabaseSettings.from_environment)
     security: SecuritySettings = field(default_factory=SecuritySettings.from_environment)
     gemini: GeminiSettings = field(default_factory=GeminiSettings.from_environment)
     forth_api: ForthAPISettings = field(default_factory=ForthAPISettings.from_environment)
+    http: HTTPClientSettings = field(default_factory=HTTPClientSettings.from_environment)
     llm: LLMSettings = field(default_factory=LLMSettings.from_environment)
     document_processing: DocumentProcessingSettings = field(default_factory=DocumentProcessingSettings.from_environment)
     aws: AWSSettings = field(default_factory=AWSSettings.from_environment)
@@ -379,6 +426,7 @@ class AppSettings:
             app_host=get_env_var("APP_HOST", "0.0.0.0"),
             app_port=get_env_var_int("APP_PORT", 8000),
             log_level=get_env_var("LOG_LEVEL", "DEBUG" if debug else "INFO"),
+            health_check_timeout=get_env_var_float("HEALTH_CHECK_TIMEOUT", 2.0),
         )
     
     @property
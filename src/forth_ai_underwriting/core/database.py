@@ -12,8 +12,8 @@ import logging
 from forth_ai_underwriting.config.settings import database, settings
 from forth_ai_underwriting.core.models import Base
 
-# Configure SQLAlchemy logging
-logging.getLogger('sqlalchemy.engine').setLevel(logging.INFO)
+# Configure SQLAlchemy logging; at INFO every statement and its parameters are formatted
+logging.getLogger('sqlalchemy.engine').setLevel(logging.INFO if settings.debug else logging.WARNING)
 
 class DatabaseManager:
     """Manages PostgreSQL database connections and sessions."""
@@ -75,16 +75,18 @@ class DatabaseManager:
         @event.listens_for(self.engine, "checkout")
         def receive_checkout(dbapi_connection, connection_record, connection_proxy):
             """Log when a connection is checked out from the pool."""
-            logger = logging.getLogger(__name__)
             if settings.debug:
-                logger.debug(f"Database connection checked out: PID {connection_record.info.get('connected_at')}")
+                logging.getLogger(__name__).debug(
+                    "Database connection checked out: PID %s", connection_record.info.get('connected_at')
+                )
         
         @event.listens_for(self.engine, "checkin")  
         def receive_checkin(dbapi_connection, connection_record):
             """Log when a connection is returned to the pool."""
-            logger = logging.getLogger(__name__)
             if settings.debug:
-                logger.debug(f"Database connection checked in: PID {connection_record.info.get('connected_at')}")
+                logging.getLogger(__name__).debug(
+                    "Database connection checked in: PID %s", connection_record.info.get('connected_at')
+                )
     
     def create_tables(self):
         """Create all database tables."""
@@ -4,7 +4,8 @@ Middleware components for security, monitoring, and request processing.
 
 import time
 import uuid
-from typing import Callable, Dict, Any, Optional
+from collections import Counter, defaultdict, deque
+from typing import Callable, Deque, Dict, Any, Optional
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -28,11 +29,11 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         # Generate request ID
-        request_id = str(uuid.uuid4())
+        request_id = uuid.uuid4().hex
         request.state.request_id = request_id
         
         # Start timing
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Log request
         client_ip = self._get_client_ip(request)
@@ -55,7 +56,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             response = await call_next(request)
             
             # Calculate processing time
-            process_time = time.time() - start_time
+            process_time = time.perf_counter() - start_time
             
             # Log response
             logger.info(
@@ -75,7 +76,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             return response
             
         except Exception as e:
-            process_time = time.time() - start_time
+            process_time = time.perf_counter() - start_time
             logger.error(
                 "Request failed",
                 extra={
@@ -122,15 +123,17 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """Redis-based rate limiting middleware."""
     
+    # Requests per minute by path (exact match, then prefix)
+    RATE_LIMITS = {
+        "/webhook/forth-docs": 100,
+        "/teams/validate": 30,
+        "/teams/feedback": 10,
+    }
+    
     def __init__(self, app: ASGIApp, redis_url: str = None):
         super().__init__(app)
-        self.redis_client = None
-        if redis_url or settings.cache.redis_url:
-            try:
-                import redis
-                self.redis_client = redis.from_url(redis_url or settings.cache.redis_url)
-            except ImportError:
-                logger.warning("Redis not available for rate limiting")
+        redis_url = redis_url or settings.cache.redis_url
+        self.redis_client = redis.from_url(redis_url) if redis_url else None
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         if not self.redis_client:
@@ -203,18 +206,13 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     
     def _get_rate_limit(self, path: str) -> int:
         """Get rate limit for specific path."""
-        rate_limits = {
-            "/webhook/forth-docs": 100,  # 100 requests per minute
-            "/teams/validate": 30,       # 30 requests per minute
-            "/teams/feedback": 10,       # 10 requests per minute
-        }
-        
         # Check for exact match first
-        if path in rate_limits:
-            return rate_limits[path]
+        limit = self.RATE_LIMITS.get(path)
+        if limit is not None:
+            return limit
         
         # Check for prefix matches
-        for pattern, limit in rate_limits.items():
+        for pattern, limit in self.RATE_LIMITS.items():
             if path.startswith(pattern):
                 return limit
         
@@ -274,46 +272,39 @@ class MetricsMiddleware(BaseHTTPMiddleware):
     
     def __init__(self, app: ASGIApp):
         super().__init__(app)
-        self.request_count = {}
-        self.response_times = {}
-        self.error_count = {}
+        self.request_count: Counter = Counter()
+        # Only the last 100 response times per endpoint are kept
+        self.response_times: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=100))
+        self.error_count: Counter = Counter()
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Track request
         method = request.method
         path = request.url.path
         key = f"{method}:{path}"
         
-        self.request_count[key] = self.request_count.get(key, 0) + 1
+        self.request_count[key] += 1
         
         try:
             response = await call_next(request)
             
             # Track response time
-            response_time = time.time() - start_time
-            if key not in self.response_times:
-                self.response_times[key] = []
-            self.response_times[key].append(response_time)
-            
-            # Keep only last 100 response times per endpoint
-            if len(self.response_times[key]) > 100:
-                self.response_times[key] = self.response_times[key][-100:]
+            self.response_times[key].append(time.perf_counter() - start_time)
             
             return response
             
         except Exception as e:
             # Track errors
-            error_key = f"{key}:error"
-            self.error_count[error_key] = self.error_count.get(error_key, 0) + 1
+            self.error_count[f"{key}:error"] += 1
             raise
     
     def get_metrics(self) -> Dict[str, Any]:
-        """Get collected metrics."""
+        """Get a snapshot of the collected metrics."""
         metrics = {
-            "request_counts": self.request_count.copy(),
-            "error_counts": self.error_count.copy(),
+            "request_counts": dict(self.request_count),
+            "error_counts": dict(self.error_count),
             "response_times": {}
         }
         
@@ -351,7 +342,7 @@ def setup_middleware(app):
     app.add_middleware(MetricsMiddleware)
     
     # Add rate limiting if Redis is available
-    if hasattr(settings.cache, 'redis_url') and settings.cache.redis_url:
+    if settings.cache.redis_url:
         app.add_middleware(RateLimitMiddleware)
     
     return app 
\ No newline at end of file
@@ -6,6 +6,7 @@ Ensures proper initialization, dependency injection, and service lifecycle manag
 from typing import Dict, Any, Optional, Type, TypeVar, Callable
 from loguru import logger
 import asyncio
+import threading
 from dataclasses import dataclass
 
 from forth_ai_underwriting.config.settings import settings
@@ -67,7 +68,7 @@ class ServiceRegistry:
             health_check_method=health_check_method
         )
         
-        logger.debug(f"Registered service: {name}")
+        logger.debug("Registered service: {}", name)
     
     def get(self, name: str, auto_initialize: bool = True) -> Any:
         """
@@ -175,42 +176,12 @@ class ServiceRegistry:
         Returns:
             Dictionary with health status of all services
         """
-        health_results = {}
-        
-        for name, service_info in self._services.items():
-            try:
-                if not service_info.initialized:
-                    health_results[name] = {
-                        "status": "not_initialized",
-                        "error": "Service not initialized"
-                    }
-                    continue
-                
-                if service_info.health_check_method:
-                    health_method = getattr(service_info.instance, service_info.health_check_method, None)
-                    if health_method:
-                        if asyncio.iscoroutinefunction(health_method):
-                            result = await health_method()
-                        else:
-                            result = health_method()
-                        health_results[name] = result
-                    else:
-                        health_results[name] = {
-                            "status": "healthy",
-                            "note": "No health check method available"
-                        }
-                else:
-                    health_results[name] = {
-                        "status": "healthy",
-                        "note": "Service initialized successfully"
-                    }
-            
-            except Exception as e:
-                health_results[name] = {
-                    "status": "unhealthy",
-                    "error": str(e)
-                }
-                logger.error(f"Health check failed for service {name}: {e}")
+        # Probes are independent, so run them concurrently rather than one after another
+        results = await asyncio.gather(*(
+            self._check_service(name, service_info)
+            for name, service_info in self._services.items()
+        ))
+        health_results = dict(zip(self._services, results))
         
         overall_status = "healthy" if all(
             result.get("status") == "healthy" 
@@ -224,6 +195,44 @@ class ServiceRegistry:
             "total_count": len(self._services)
         }
     
+    async def _check_service(self, name: str, service_info: ServiceInfo) -> Dict[str, Any]:
+        """Run the health check for a single service."""
+        try:
+            if not service_info.initialized:
+                return {
+                    "status": "not_initialized",
+                    "error": "Service not initialized"
+                }
+            
+            if service_info.health_check_method:
+                health_method = getattr(service_info.instance, service_info.health_check_method, None)
+                if health_method:
+                    if asyncio.iscoroutinefunction(health_method):
+                        # A stuck probe must not hold up the whole report
+                        return await asyncio.wait_for(health_method(), timeout=settings.health_check_timeout)
+                    return health_method()
+                return {
+                    "status": "healthy",
+                    "note": "No health check method available"
+                }
+            return {
+                "status": "healthy",
+                "note": "Service initialized successfully"
+            }
+        
+        except asyncio.TimeoutError:
+            logger.error(f"Health check timed out for service {name}")
+            return {
+                "status": "timeout",
+                "error": f"Health check exceeded {settings.health_check_timeout}s"
+            }
+        except Exception as e:
+            logger.error(f"Health check failed for service {name}: {e}")
+            return {
+                "status": "unhealthy",
+                "error": str(e)
+            }
+    
     def get_service_info(self, name: str) -> Optional[ServiceInfo]:
         """Get service information by name."""
         return self._services.get(name)
@@ -264,7 +273,7 @@ class ServiceRegistry:
                         else:
                             shutdown_method()
                     
-                    logger.debug(f"Shutdown service: {service_name}")
+                    logger.debug("Shutdown service: {}", service_name)
                     
                 except Exception as e:
                     logger.error(f"Error shutting down service {service_name}: {e}")
@@ -275,13 +284,17 @@ class ServiceRegistry:
 
 # Global service registry instance
 _service_registry: Optional[ServiceRegistry] = None
+_service_registry_lock = threading.Lock()
 
 
 def get_service_registry() -> ServiceRegistry:
     """Get the global service registry instance."""
     global _service_registry
     if _service_registry is None:
-        _service_registry = ServiceRegistry()
+        # Double-checked so concurrent first calls build only one instance
+        with _service_registry_lock:
+            if _service_registry is None:
+                _service_registry = ServiceRegistry()
     return _service_registry
 
 
@@ -3,6 +3,9 @@ AI Parser service for orchestrating document processing and parsing.
 Serves as the main entry point for document analysis, delegating to specialized services.
 """
 
+import asyncio
+import threading
+from dataclasses import fields, is_dataclass
 from typing import Dict, Any, Optional
 from loguru import logger
 
@@ -84,12 +87,13 @@ class AIParserService:
         Returns:
             Dictionary representation of contract data
         """
-        if hasattr(contract_data, '__dict__'):
-            # DataClass object
+        if is_dataclass(contract_data):
+            # DataClass object (slotted, so there is no __dict__)
             result = {}
-            for field, value in contract_data.__dict__.items():
+            for field in fields(contract_data):
+                value = getattr(contract_data, field.name)
                 if value is not None:
-                    result[field] = value
+                    result[field.name] = value
             return self._ensure_structure(result)
         else:
             # Already a dictionary
@@ -221,8 +225,10 @@ class AIParserService:
             Health status of all components
         """
         try:
-            processor_health = await self.document_processor.health_check()
-            gemini_health = await self.gemini_service.health_check()
+            processor_health, gemini_health = await asyncio.gather(
+                self.document_processor.health_check(),
+                self.gemini_service.health_check()
+            )
             
             return {
                 "status": "healthy" if processor_health["status"] == "healthy" and gemini_health["status"] == "healthy" else "degraded",
@@ -241,13 +247,17 @@ class AIParserService:
 
 # Global AI parser service instance
 _ai_parser_service: Optional[AIParserService] = None
+_ai_parser_service_lock = threading.Lock()
 
 
 def get_ai_parser_service() -> AIParserService:
     """Get the global AI parser service instance."""
     global _ai_parser_service
     if _ai_parser_service is None:
-        _ai_parser_service = AIParserService()
+        # Double-checked so concurrent first calls build only one instance
+        with _ai_parser_service_lock:
+            if _ai_parser_service is None:
+                _ai_parser_service = AIParserService()
     return _ai_parser_service
 
 
@@ -2,10 +2,11 @@
 Prompt management system with templating, versioning, and validation.
 """
 
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from enum import Enum
 from dataclasses import dataclass, field
-from pydantic import BaseModel, Field, validator
+from string import Formatter
+from pydantic import BaseModel, Field, PrivateAttr, validator
 import json
 from pathlib import Path
 from datetime import datetime
@@ -46,6 +47,9 @@ class PromptTemplate(BaseModel):
     examples: List[Dict[str, Any]] = Field(default_factory=list, description="Example inputs/outputs")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
+    # User prompt pre-split into (literal, field name) pairs on first render
+    _fragments: Optional[Tuple[Tuple[str, Optional[str]], ...]] = PrivateAttr(default=None)
+    
     @validator('user_prompt_template')
     def validate_template_variables(cls, v, values):
         """Validate that template variables are properly formatted."""
@@ -75,26 +79,60 @@ class PromptTemplate(BaseModel):
         Returns:
             Dict with 'system_prompt', 'user_prompt', and optionally 'format_instructions'
         """
-        # Validate required variables
-        missing_required = set(self.required_variables) - set(kwargs.keys())
-        if missing_required:
-            raise ValueError(f"Missing required variables: {missing_required}")
-        
-        # Render user prompt
-        try:
-            user_prompt = self.user_prompt_template.format(**kwargs)
-        except KeyError as e:
-            raise ValueError(f"Template variable not provided: {e}")
-        
         result = {
             "system_prompt": self.system_prompt,
-            "user_prompt": user_prompt
+            "user_prompt": self.render_user_prompt(**kwargs)
         }
         
         if self.format_instructions:
             result["format_instructions"] = self.format_instructions
         
         return result
+    
+    def render_user_prompt(self, **kwargs) -> str:
+        """
+        Render only the user prompt; the system prompt is static and can be reused as-is.
+        
+        Returns:
+            Rendered user prompt
+        """
+        # Validate required variables
+        missing_required = set(self.required_variables) - kwargs.keys()
+        if missing_required:
+            raise ValueError(f"Missing required variables: {missing_required}")
+        
+        if self._fragments is None:
+            self._fragments = self._compile_user_prompt()
+        
+        if not self._fragments:
+            # Template uses format specs or conversions; let str.format handle it
+            try:
+                return self.user_prompt_template.format(**kwargs)
+            except KeyError as e:
+                raise ValueError(f"Template variable not provided: {e}")
+        
+        parts = []
+        for literal, field_name in self._fragments:
+            parts.append(literal)
+            if field_name is not None:
+                if field_name not in kwargs:
+                    raise ValueError(f"Template variable not provided: '{field_name}'")
+                parts.append(str(kwargs[field_name]))
+        return "".join(parts)
+    
+    def _compile_user_prompt(self) -> Tuple[Tuple[str, Optional[str]], ...]:
+        """
+        Split the user prompt template into literal text and field names once.
+        
+        Returns:
+            Fragments, or an empty tuple if the template needs full str.format semantics
+        """
+        fragments = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(self.user_prompt_template):
+            if format_spec or conversion or (field_name is not None and not field_name.isidentifier()):
+                return ()
+            fragments.append((literal, field_name))
+        return tuple(fragments)
 
 
 class PromptManager:
@@ -106,6 +144,7 @@ class PromptManager:
         self._prompts: Dict[str, PromptTemplate] = {}
         self._category_index: Dict[PromptCategory, List[str]] = {}
         self._version_index: Dict[str, Dict[PromptVersion, str]] = {}
+        self._latest_index: Dict[str, str] = {}
         self._initialize_default_prompts()
         logger.info("PromptManager initialized with default prompts")
     
@@ -125,7 +164,11 @@ class PromptManager:
             self._version_index[prompt.name] = {}
         self._version_index[prompt.name][prompt.version] = prompt_key
         
-        logger.debug(f"Registered prompt: {prompt.name} v{prompt.version}")
+        # Resolve the latest version once at registration instead of on every lookup
+        latest_version = max(self._version_index[prompt.name], key=lambda v: v.value)
+        self._latest_index[prompt.name] = self._version_index[prompt.name][latest_version]
+        
+        logger.debug("Registered prompt: {} v{}", prompt.name, prompt.version)
     
     def get_prompt(
         self, 
@@ -134,13 +177,8 @@ class PromptManager:
     ) -> Optional[PromptTemplate]:
         """Get a prompt template by name and version."""
         if version == PromptVersion.LATEST:
-            # Get the latest version
-            if name in self._version_index:
-                versions = list(self._version_index[name].keys())
-                # Sort versions and get the latest
-                latest_version = max(versions, key=lambda v: v.value)
-                prompt_key = self._version_index[name][latest_version]
-            else:
+            prompt_key = self._latest_index.get(name)
+            if prompt_key is None:
                 return None
         else:
             prompt_key = f"{name}_{version}"
@@ -0,0 +1,241 @@
+"""
+Local creditor matching for debt validation.
+Resolves deterministic debt checks against reference data without an LLM round trip.
+"""
+
+import difflib
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from loguru import logger
+
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# Corporate suffixes stripped before comparing creditor names
+_CORPORATE_SUFFIXES = frozenset({
+    "INC", "LLC", "LTD", "CORP", "CORPORATION", "CO", "COMPANY", "NA", "FSB", "PLC"
+})
+_NON_ALNUM = re.compile(r"[^A-Z0-9]+")
+
+# Reviewed alternate names for high-risk creditors. Reference entries such as
+# "GS Bank/Apple Card Services" are not split on "/" automatically, since the
+# fragments ("WF", "GS BANK", "RK") would match unrelated creditors
+HIGH_RISK_CREDITOR_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "GS Bank/Apple Card Services": ("Apple Card Services", "Apple Card"),
+    "Mac Credit/Matco Tools": ("Matco Tools",),
+    "WF/Bobs Furniture": ("Bobs Furniture",),
+}
+
+
+def normalize_creditor_name(name: str) -> str:
+    """Normalize a creditor name to uppercase alphanumeric tokens without corporate suffixes."""
+    tokens = _NON_ALNUM.sub(" ", name.upper()).split()
+    while tokens:
+        if tokens[-1] in _CORPORATE_SUFFIXES:
+            tokens.pop()
+        elif tokens[-2:] == ["N", "A"]:
+            del tokens[-2:]
+        else:
+            break
+    return " ".join(tokens)
+
+
+def load_creditor_database() -> Dict[str, Any]:
+    """Load the creditor-related reference data used for debt validation."""
+    try:
+        with open(DATA_DIR / "enhanced_reference_tables.json", "r") as f:
+            reference_data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error(f"Failed to load creditor reference data: {e}")
+        reference_data = {}
+
+    return {
+        "high_risk_creditors": reference_data.get("high_risk_creditors", []),
+        "acceptable_debt_types": reference_data.get("acceptable_debt_types", []),
+        "unacceptable_debt_types": reference_data.get("unacceptable_debt_types", []),
+        "minimum_debt_per_creditor": reference_data.get("validation_thresholds", {}).get(
+            "minimum_debt_per_creditor", 500.0
+        ),
+    }
+
+
+class CreditorMatcher:
+    """
+    Matches debts against the creditor reference data.
+
+    Only outcomes that are fully determined by the reference data are resolved
+    locally (prohibited debt types and high-risk creditors); everything else is
+    left for the LLM.
+    """
+
+    def __init__(
+        self,
+        creditor_database: Dict[str, Any],
+        match_threshold: float = 0.92,
+        aliases: Optional[Dict[str, Tuple[str, ...]]] = None
+    ):
+        self.match_threshold = match_threshold
+        self.minimum_debt = float(creditor_database.get("minimum_debt_per_creditor", 500.0))
+        self.unacceptable_debt_types = frozenset(
+            debt_type.lower() for debt_type in creditor_database.get("unacceptable_debt_types", [])
+        )
+
+        if aliases is None:
+            aliases = HIGH_RISK_CREDITOR_ALIASES
+
+        # Map every normalized full name and reviewed alias to its canonical creditor
+        self._aliases: Dict[str, str] = {}
+        for creditor in creditor_database.get("high_risk_creditors", []):
+            for alias in (creditor, *aliases.get(creditor, ())):
+                normalized = normalize_creditor_name(alias)
+                if normalized:
+                    self._aliases.setdefault(normalized, creditor)
+        self._alias_names = list(self._aliases)
+
+    def match_high_risk(self, creditor_name: str) -> Tuple[Optional[str], float]:
+        """
+        Find the high-risk creditor matching a name.
+
+        Returns:
+            Tuple of (canonical creditor name or None, match score)
+        """
+        normalized = normalize_creditor_name(creditor_name or "")
+        if not normalized:
+            return None, 0.0
+
+        if normalized in self._aliases:
+            return self._aliases[normalized], 1.0
+
+        candidates = difflib.get_close_matches(
+            normalized, self._alias_names, n=1, cutoff=self.match_threshold
+        )
+        if candidates:
+            score = difflib.SequenceMatcher(None, normalized, candidates[0]).ratio()
+            return self._aliases[candidates[0]], score
+
+        return None, 0.0
+
+    def resolve(self, debt: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Validate a single debt locally.
+
+        Returns:
+            An account validation entry, or None if the debt needs LLM review
+        """
+        creditor_name = debt.get("creditor_name") or debt.get("creditor") or ""
+        debt_type = str(debt.get("debt_type") or "").lower()
+        amount = debt.get("debt_amount", debt.get("balance"))
+
+        concerns: List[str] = []
+        if isinstance(amount, (int, float)) and amount < self.minimum_debt:
+            concerns.append(f"Debt amount below ${self.minimum_debt:.0f} minimum")
+
+        if debt_type in self.unacceptable_debt_types:
+            return self._entry(debt, creditor_name, amount, "prohibited", "high",
+                               [f"Unacceptable debt type: {debt_type}", *concerns])
+
+        matched_creditor, score = self.match_high_risk(creditor_name)
+        if matched_creditor:
+            return self._entry(debt, creditor_name, amount, "conditional", "high",
+                               [f"High-risk creditor: {matched_creditor}", *concerns],
+                               match_score=score)
+
+        return None
+
+    def partition(self, debt_list: List[Dict[str, Any]]) -> Tuple[List[Optional[Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        Split debts into locally resolved entries and the remainder needing LLM review.
+
+        Returns:
+            Tuple of (per-debt entries with None for unresolved debts, unresolved debts)
+        """
+        resolved = [self.resolve(debt) for debt in debt_list]
+        unresolved = [debt for debt, entry in zip(debt_list, resolved) if entry is None]
+        return resolved, unresolved
+
+    @staticmethod
+    def _entry(
+        debt: Dict[str, Any],
+        creditor_name: str,
+        amount: Any,
+        status: str,
+        risk_level: str,
+        concerns: List[str],
+        match_score: float = 1.0
+    ) -> Dict[str, Any]:
+        """Build an account validation entry in the LLM output format."""
+        return {
+            "creditor_name": creditor_name,
+            "debt_amount": amount,
+            "debt_type": debt.get("debt_type", "other"),
+            "status": status,
+            "risk_level": risk_level,
+            "concerns": concerns,
+            "validation_source": "local",
+            "match_score": round(match_score, 3),
+        }
+
+
+def _account_key(account: Dict[str, Any]) -> str:
+    """Key matching a debt to its account validation entry: the normalized creditor name."""
+    return normalize_creditor_name(account.get("creditor_name") or account.get("creditor") or "")
+
+
+def merge_account_validations(
+    debt_list: List[Dict[str, Any]],
+    resolved: List[Optional[Dict[str, Any]]],
+    llm_entries: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Merge local and LLM account validations back into the original debt order.
+
+    LLM entries are matched to debts by creditor name, and by amount when
+    several debts share a name, so the LLM may return them in any order.
+    Entries that match no debt are appended at the end rather than dropped.
+
+    Args:
+        debt_list: Debts in their original order
+        resolved: Per-debt local entries from CreditorMatcher.partition
+        llm_entries: Account validations returned by the LLM for the unresolved debts
+
+    Returns:
+        Account validation entries in debt order
+    """
+    pending: Dict[str, List[Dict[str, Any]]] = {}
+    for entry in llm_entries:
+        pending.setdefault(_account_key(entry), []).append(entry)
+
+    merged = []
+    for debt, entry in zip(debt_list, resolved):
+        if entry is None:
+            candidates = pending.get(_account_key(debt))
+            if candidates:
+                amount = debt.get("debt_amount", debt.get("balance"))
+                index = next(
+                    (i for i, candidate in enumerate(candidates) if candidate.get("debt_amount") == amount), 0
+                )
+                entry = candidates.pop(index)
+        if entry is not None:
+            merged.append(entry)
+
+    merged.extend(entry for entries in pending.values() for entry in entries)
+    return merged
+
+
+# Global creditor matcher instance
+_creditor_matcher: Optional[CreditorMatcher] = None
+_creditor_matcher_lock = threading.Lock()
+
+
+def get_creditor_matcher() -> CreditorMatcher:
+    """Get the global creditor matcher instance."""
+    global _creditor_matcher
+    if _creditor_matcher is None:
+        # Double-checked so concurrent first calls build only one instance
+        with _creditor_matcher_lock:
+            if _creditor_matcher is None:
+                _creditor_matcher = CreditorMatcher(load_creditor_database())
+    return _creditor_matcher
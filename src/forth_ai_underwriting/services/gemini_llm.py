@@ -4,14 +4,112 @@ Clean implementation of the LLMService interface for Google Gemini.
 """
 
 import json
+import re
 import asyncio
-from typing import Dict, Optional, AsyncGenerator
+from typing import Any, Dict, List, Optional, AsyncGenerator
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 from loguru import logger
 
 from forth_ai_underwriting.config.settings import settings
+from forth_ai_underwriting.core.exceptions import ExternalAPIError, create_external_api_error
 from forth_ai_underwriting.services.llm_service import LLMService, LLMResult
-from forth_ai_underwriting.utils.retry import retry_ai_api
+from forth_ai_underwriting.utils.retry import retry_ai_api, CircuitBreaker
+
+try:
+    # orjson raises a json.JSONDecodeError subclass, so error handling is unchanged
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# SDK errors worth retrying: overload, rate limiting and timeouts
+_TRANSIENT_GOOGLE_ERRORS = (
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.TooManyRequests,
+)
+
+# Fallback for SDK errors whose type does not identify them as rate limiting
+_RATE_LIMIT_RE = re.compile(r"rate[\s_-]?limit|quota|\b429\b|resource[\s_]exhausted", re.IGNORECASE)
+
+
+def _is_transient(error: google_exceptions.GoogleAPICallError) -> bool:
+    """Check whether an SDK error is worth retrying, by type first and message second."""
+    return isinstance(error, _TRANSIENT_GOOGLE_ERRORS) or bool(_RATE_LIMIT_RE.search(error.message or ""))
+
+# Fast-fail Gemini calls for 30s after 5 calls within a minute exhaust their retries
+_gemini_circuit_breaker = CircuitBreaker(
+    failure_threshold=5,
+    recovery_timeout=30.0,
+    expected_exception=ExternalAPIError,
+    failure_window=60.0
+)
+
+
+# Appended to prompts that expect a JSON response
+_JSON_INSTRUCTION = "\n\nProvide your response as valid JSON."
+
+# Markdown code fences around JSON; a "json" fence is preferred over a bare one
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)```", re.DOTALL)
+_CODE_FENCE_RE = re.compile(r"```\s*(.*?)```", re.DOTALL)
+
+# Schema keywords kept when a schema is quoted in a JSON prompt
+_RESPONSE_SCHEMA_KEYS = ("type", "description", "enum", "items", "properties", "required", "nullable")
+_RESPONSE_SCHEMA_FORMATS = {"number": {"float", "double"}, "integer": {"int32", "int64"}, "string": {"enum", "date-time"}}
+
+
+def to_response_schema(json_schema: Dict[str, Any], defs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Reduce a JSON schema (e.g. from Pydantic's model_json_schema) to a compact subset for prompts.
+    
+    References are inlined, Optional unions become nullable, and keywords that
+    only add prompt tokens (titles, defaults, numeric bounds, most formats) are
+    dropped. Free-form objects without properties are omitted from their parent.
+    """
+    if defs is None:
+        defs = json_schema.get("$defs", {})
+    
+    if "$ref" in json_schema:
+        resolved = dict(defs[json_schema["$ref"].rsplit("/", 1)[-1]])
+        if "description" in json_schema:
+            resolved["description"] = json_schema["description"]
+        return to_response_schema(resolved, defs)
+    
+    if "anyOf" in json_schema:
+        options = [option for option in json_schema["anyOf"] if option.get("type") != "null"]
+        converted = to_response_schema(options[0], defs)
+        if len(options) < len(json_schema["anyOf"]):
+            converted["nullable"] = True
+        if "description" in json_schema:
+            converted["description"] = json_schema["description"]
+        return converted
+    
+    schema = {key: json_schema[key] for key in _RESPONSE_SCHEMA_KEYS if key in json_schema}
+    if "enum" in schema:
+        schema["type"] = "string"
+        schema["enum"] = [str(value) for value in schema["enum"]]
+    
+    schema_format = json_schema.get("format")
+    if schema_format in _RESPONSE_SCHEMA_FORMATS.get(schema.get("type"), ()):
+        schema["format"] = schema_format
+    
+    if "items" in schema:
+        schema["items"] = to_response_schema(schema["items"], defs)
+    
+    if "properties" in schema:
+        properties = {}
+        for name, property_schema in schema["properties"].items():
+            converted = to_response_schema(property_schema, defs)
+            if converted.get("type") == "object" and not converted.get("properties"):
+                continue
+            properties[name] = converted
+        schema["properties"] = properties
+        schema["required"] = [name for name in schema.get("required", []) if name in properties]
+    
+    return schema
 
 
 class GeminiProvider(LLMService):
@@ -22,22 +120,23 @@ class GeminiProvider(LLMService):
         self.model_name = settings.gemini.model_name
         self.temperature = settings.gemini.temperature
         self.max_tokens = settings.gemini.max_output_tokens
+        self.embedding_model = settings.gemini.embedding_model
         
-        # Configure Gemini
+        # Configure Gemini; the gRPC transport keeps one multiplexed HTTP/2 channel for all calls
         if settings.gemini.use_aws_secrets and settings.gemini.credentials_path:
             # Use service account from AWS Secrets Manager
             import os
             os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = settings.gemini.credentials_path
+            genai.configure(transport="grpc")
             logger.info("Using Gemini credentials from AWS Secrets Manager")
         else:
             # Use API key
-            genai.configure(api_key=settings.gemini.api_key)
+            genai.configure(api_key=settings.gemini.api_key, transport="grpc")
             logger.info("Using Gemini with API key")
         
         self.model = genai.GenerativeModel(self.model_name)
         logger.info(f"GeminiProvider initialized with model: {self.model_name}")
     
-    @retry_ai_api
     async def generate_text(
         self, 
         prompt: str, 
@@ -47,13 +146,8 @@ class GeminiProvider(LLMService):
     ) -> LLMResult:
         """Generate text using Gemini."""
         try:
-            # Prepare the prompt
-            full_prompt = self._prepare_prompt(prompt, system_prompt)
-            
-            # Generate content
-            response = await asyncio.to_thread(
-                self.model.generate_content,
-                full_prompt,
+            response = await self._generate_content(
+                self._prepare_prompt(prompt, system_prompt),
                 generation_config={
                     "temperature": temperature or self.temperature,
                     "max_output_tokens": max_tokens or self.max_tokens,
@@ -73,10 +167,10 @@ class GeminiProvider(LLMService):
             logger.error(f"Gemini text generation failed: {e}")
             return LLMResult(
                 success=False,
-                error=str(e)
+                error=str(e),
+                metadata={"error_code": getattr(e, "error_code", None)}
             )
     
-    @retry_ai_api
     async def generate_json(
         self,
         prompt: str,
@@ -85,22 +179,20 @@ class GeminiProvider(LLMService):
     ) -> LLMResult:
         """Generate JSON using Gemini."""
         try:
-            # Add JSON formatting instructions
-            json_prompt = prompt + "\n\nProvide your response as valid JSON."
+            # Add JSON formatting instructions; the pinned SDK (google-generativeai 0.3)
+            # has no native JSON mode, so the schema is described in the prompt
+            suffix = _JSON_INSTRUCTION
             if schema:
-                json_prompt += f"\n\nExpected schema: {json.dumps(schema, indent=2)}"
+                suffix += f"\n\nExpected schema: {json.dumps(to_response_schema(schema))}"
+            full_prompt = self._prepare_prompt(prompt, system_prompt, suffix)
             
-            full_prompt = self._prepare_prompt(json_prompt, system_prompt)
+            generation_config = {
+                "temperature": 0.0,  # Use low temperature for structured output
+                "max_output_tokens": self.max_tokens,
+            }
             
             # Generate content
-            response = await asyncio.to_thread(
-                self.model.generate_content,
-                full_prompt,
-                generation_config={
-                    "temperature": 0.0,  # Use low temperature for structured output
-                    "max_output_tokens": self.max_tokens,
-                }
-            )
+            response = await self._generate_content(full_prompt, generation_config)
             
             # Parse JSON from response
             content = response.text
@@ -127,26 +219,61 @@ class GeminiProvider(LLMService):
             logger.error(f"Gemini JSON generation failed: {e}")
             return LLMResult(
                 success=False,
-                error=str(e)
+                error=str(e),
+                metadata={"error_code": getattr(e, "error_code", None)}
             )
     
+    @_gemini_circuit_breaker
+    @retry_ai_api
+    async def _generate_content(self, full_prompt: str, generation_config: Dict[str, Any], stream: bool = False):
+        """
+        Call the Gemini SDK, surfacing transient failures as ExternalAPIError so they are retried.
+        
+        With stream=True only opening the stream (which waits for the first
+        chunk) is retried; failures while reading it are the caller's to handle.
+        """
+        try:
+            return await self.model.generate_content_async(
+                full_prompt,
+                generation_config=generation_config,
+                stream=stream
+            )
+        except google_exceptions.GoogleAPICallError as e:
+            if not _is_transient(e):
+                raise
+            raise create_external_api_error("gemini", e.code or 503, str(e))
+    
     async def generate_streaming(
         self,
         prompt: str,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        json_output: bool = False
     ) -> AsyncGenerator[str, None]:
-        """Generate text with streaming (simulated for Gemini)."""
-        # Gemini doesn't have true streaming in the Python SDK yet
-        # Simulate streaming by generating full response and yielding chunks
-        result = await self.generate_text(prompt, system_prompt)
+        """
+        Generate text with streaming, yielding chunks as the model produces them.
+        
+        Errors are raised rather than yielded, so callers can tell a failed or
+        cut-off stream from model output.
+        """
+        full_prompt = self._prepare_prompt(prompt, system_prompt, _JSON_INSTRUCTION if json_output else "")
+        
+        generation_config = {
+            "temperature": 0.0 if json_output else (temperature or self.temperature),
+            "max_output_tokens": self.max_tokens,
+        }
         
-        if result.success and result.content:
-            chunk_size = 50
-            for i in range(0, len(result.content), chunk_size):
-                yield result.content[i:i + chunk_size]
-                await asyncio.sleep(0.05)  # Small delay to simulate streaming
-        elif not result.success:
-            yield f"Error: {result.error}"
+        response = await self._generate_content(full_prompt, generation_config, stream=True)
+        try:
+            async for chunk in response:
+                # The final chunk may carry only the finish reason and usage
+                if chunk.candidates and chunk.parts:
+                    yield chunk.text
+        except google_exceptions.GoogleAPICallError as e:
+            logger.error(f"Gemini streaming generation failed: {e}")
+            if not _is_transient(e):
+                raise
+            raise create_external_api_error("gemini", e.code or 503, str(e))
     
     async def test_connection(self) -> bool:
         """Test Gemini connection."""
@@ -160,32 +287,72 @@ class GeminiProvider(LLMService):
             logger.error(f"Gemini connection test failed: {e}")
             return False
     
-    def _prepare_prompt(self, prompt: str, system_prompt: Optional[str] = None) -> str:
-        """Prepare the full prompt with system instructions."""
+    async def embed_text(self, text: str) -> Optional[List[float]]:
+        """Embed text with the configured Gemini embedding model."""
+        try:
+            # The pinned SDK only ships a blocking embed_content, so it runs off the event loop
+            result = await asyncio.to_thread(
+                genai.embed_content,
+                model=self.embedding_model,
+                content=text,
+                task_type="semantic_similarity"
+            )
+            return result["embedding"]
+        except Exception as e:
+            logger.warning(f"Gemini embedding failed: {e}")
+            return None
+    
+    async def warm_up(self) -> None:
+        """
+        Open the async gRPC channel with a token count request.
+        
+        Counting tokens is free and generates nothing, but still creates the
+        SDK client and completes the TLS and HTTP/2 handshakes, so the first
+        real request starts on a warm connection.
+        """
+        try:
+            await self.model.count_tokens_async("ping")
+            logger.info("Gemini connection warmed up")
+        except Exception as e:
+            logger.warning(f"Gemini warm-up failed: {e}")
+    
+    async def close(self) -> None:
+        """Close the SDK clients' gRPC channels."""
+        client = getattr(self.model, "_client", None)
+        if client is not None:
+            await asyncio.to_thread(client.transport.close)
+        async_client = getattr(self.model, "_async_client", None)
+        if async_client is not None:
+            await async_client.transport.close()
+        if client is not None or async_client is not None:
+            logger.info("Gemini client connections closed")
+    
+    def _prepare_prompt(self, prompt: str, system_prompt: Optional[str] = None, suffix: str = "") -> str:
+        """
+        Prepare the full prompt with system instructions, copying the prompt text only once.
+        
+        The pinned SDK (google-generativeai 0.3) has no system_instruction
+        parameter, so the system prompt is sent ahead of the user prompt.
+        """
         if system_prompt:
-            return f"{system_prompt}\n\n{prompt}"
-        return prompt
+            return f"{system_prompt}\n\n{prompt}{suffix}"
+        return f"{prompt}{suffix}" if suffix else prompt
     
-    def _parse_json_response(self, content: str) -> Dict:
-        """Parse JSON from response, handling markdown code blocks."""
+    def _parse_json_response(self, content: str) -> Optional[Any]:
+        """
+        Parse JSON from a response, handling markdown code blocks.
+        
+        Returns:
+            The decoded JSON value, or None if the content is not valid JSON
+        """
+        match = _JSON_FENCE_RE.search(content) or _CODE_FENCE_RE.search(content)
+        if match:
+            content = match.group(1)
         try:
-            # Try to extract JSON from markdown code blocks
-            if "```json" in content:
-                json_start = content.find("```json") + 7
-                json_end = content.find("```", json_start)
-                if json_end != -1:
-                    content = content[json_start:json_end].strip()
-            elif "```" in content:
-                # Generic code block
-                json_start = content.find("```") + 3
-                json_end = content.find("```", json_start)
-                if json_end != -1:
-                    content = content[json_start:json_end].strip()
-            
-            return json.loads(content.strip())
+            return _json_loads(content)
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse JSON response: {e}")
-            return {"error": "JSON parsing failed", "raw_content": content}
+            return None
     
     def _extract_usage(self, response) -> Dict:
         """Extract token usage information from response."""
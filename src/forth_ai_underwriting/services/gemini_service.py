@@ -4,20 +4,37 @@ Clean service using the centralized prompt management system.
 """
 
 import asyncio
+import functools
+import hashlib
 import json
-from typing import Dict, Any, List, Optional, Union
-from dataclasses import dataclass
+import re
+import threading
+import time
+from collections import Counter
+from typing import Dict, Any, List, Optional, Union, AsyncIterator, Callable, Tuple, TypeVar
+from dataclasses import dataclass, fields
 from loguru import logger
 
-from forth_ai_underwriting.services.llm_service import get_llm_service
+from forth_ai_underwriting.services.llm_service import get_llm_service, LLMResult
 from forth_ai_underwriting.config.settings import settings
 from forth_ai_underwriting.core.exceptions import create_ai_parsing_error
+from forth_ai_underwriting.utils.json_stream import IncrementalJSONObjectParser
+from forth_ai_underwriting.utils.single_flight import SingleFlight
+from forth_ai_underwriting.services.creditor_matcher import (
+    CreditorMatcher,
+    get_creditor_matcher,
+    load_creditor_database,
+    merge_account_validations
+)
+from forth_ai_underwriting.services.hardship_classifier import HardshipClassifier, get_hardship_classifier
+from forth_ai_underwriting.services.semantic_cache import SemanticCache
 from forth_ai_underwriting.prompts import (
+    PromptTemplate,
     get_hardship_assessment_prompt,
-    get_contract_extraction_prompt,
     get_budget_analysis_prompt,
     get_debt_validation_prompt
 )
+from forth_ai_underwriting.prompts.prompt_manager import get_prompt_template
 from forth_ai_underwriting.models.hardship_models import (
     HardshipAssessment as HardshipAssessmentModel,
     HardshipAnalysis,
@@ -27,8 +44,94 @@ from forth_ai_underwriting.models.hardship_models import (
 )
 from forth_ai_underwriting.models.contract_models import ContractData as ContractDataModel
 
+T = TypeVar("T")
+
+
+# Rough Gemini tokenizer ratio for English legal text; avoids a count_tokens round trip
+_CHARS_PER_TOKEN = 4
+
+# Lines that introduce the sections the contract extraction prompt asks for
+_CONTRACT_SECTION_ANCHORS = re.compile(
+    r"(?i)\b(signatures?|signed|ip address|bank(?:ing)? details|routing|account number|"
+    r"gateway|vlp|legal plan|mailing address|enrollment|first draft|date of birth)\b"
+)
+_PAGE_MARKER = re.compile(r"(?i)^\s*(page\s+\d+(\s+of\s+\d+)?|\d+\s*/\s*\d+|-\s*\d+\s*-)\s*$")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _prepare_contract_text(text: str, max_tokens: int = 8000, context_lines: int = 100) -> str:
+    """
+    Trim contract text to a token budget before sending it to Gemini.
+    
+    Text within the budget is returned unchanged. Otherwise page markers
+    and running headers/footers (short lines repeated next to page markers)
+    are removed first; if the text still exceeds the budget, only windows of
+    lines around the section anchors of the extracted fields are kept, with
+    duplicate boilerplate lines emitted once.
+    
+    Args:
+        text: Full extracted document text
+        max_tokens: Approximate input token budget
+        context_lines: Lines kept on each side of a section anchor
+        
+    Returns:
+        Text to embed in the extraction prompt
+    """
+    max_chars = max_tokens * _CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    
+    lines = text.splitlines()
+    normalized = [_WHITESPACE.sub(" ", line).strip().lower() for line in lines]
+    
+    # Short lines repeated on several pages right next to a page marker are headers/footers
+    content = [index for index, norm in enumerate(normalized) if norm]
+    near_marker = set()
+    for position, index in enumerate(content):
+        if _PAGE_MARKER.match(lines[index]):
+            near_marker.update(content[max(0, position - 1):position + 2])
+    counts = Counter(norm for norm in normalized if norm and len(norm) < 80)
+    page_furniture = {
+        normalized[index] for index in near_marker
+        if counts[normalized[index]] >= 3 and not _CONTRACT_SECTION_ANCHORS.search(lines[index])
+    }
+    kept = [
+        (line, norm) for line, norm in zip(lines, normalized)
+        if not _PAGE_MARKER.match(line) and norm not in page_furniture
+    ]
+    lines = [line for line, _ in kept]
+    normalized = [norm for _, norm in kept]
+    
+    cleaned = "\n".join(lines)
+    if len(cleaned) <= max_chars:
+        return cleaned
+    
+    # Over budget: keep windows around section anchors, in document order
+    keep = set()
+    for index, line in enumerate(lines):
+        if _CONTRACT_SECTION_ANCHORS.search(line):
+            keep.update(range(max(0, index - context_lines), min(len(lines), index + context_lines + 1)))
+    
+    selected: List[str] = []
+    seen = set()
+    size = 0
+    for index in sorted(keep):
+        norm = normalized[index]
+        if norm:
+            if norm in seen:
+                continue
+            seen.add(norm)
+        size += len(lines[index]) + 1
+        if size > max_chars:
+            break
+        selected.append(lines[index])
+    
+    trimmed = "\n".join(selected) if selected else cleaned[:max_chars]
+    logger.info(f"Trimmed contract text from {len(text)} to {len(trimmed)} characters for a {max_tokens}-token budget")
+    return trimmed
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContractData:
     """Structured contract data extracted from documents."""
     sender_ip: Optional[str] = None
@@ -43,7 +146,7 @@ class ContractData:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HardshipAssessment:
     """Hardship assessment result."""
     is_valid: bool
@@ -53,6 +156,116 @@ class HardshipAssessment:
     assessment_details: Dict[str, Any]
 
 
+@functools.cache
+def _creditor_db_json() -> str:
+    """Creditor reference data in canonical form, serialized once on first debt validation."""
+    return json.dumps(load_creditor_database(), sort_keys=True, separators=(",", ":"))
+
+
+@functools.cache
+def _creditor_db_hash() -> str:
+    """Short content hash identifying the creditor reference data version."""
+    return hashlib.sha256(_creditor_db_json().encode()).hexdigest()[:16]
+
+
+# Output fields of the hardship assessment prompt, quoted to the model as the expected schema
+_HARDSHIP_OUTPUT_FIELDS = (
+    "assessment_result", "hardship_analysis", "description_quality", "keywords_found",
+    "detailed_reasoning", "risk_factors", "strengths", "recommendations"
+)
+_hardship_json_schema = HardshipAssessmentModel.model_json_schema()
+_HARDSHIP_RESPONSE_SCHEMA = {
+    "$defs": _hardship_json_schema.get("$defs", {}),
+    "type": "object",
+    "properties": {name: _hardship_json_schema["properties"][name] for name in _HARDSHIP_OUTPUT_FIELDS},
+    "required": list(_HARDSHIP_OUTPUT_FIELDS),
+}
+
+# Client context rendered into the hardship prompt; all of it is part of the semantic cache tag
+_HARDSHIP_CONTEXT_FIELDS = ("age", "family_size", "employment_status", "monthly_income", "total_debt")
+
+# ContractData field -> key in the extraction response, where they differ
+_CONTRACT_FIELD_KEYS = {"metadata": "document_metadata"}
+_CONTRACT_FIELDS = tuple(
+    (field.name, _CONTRACT_FIELD_KEYS.get(field.name, field.name)) for field in fields(ContractData)
+)
+
+
+# Payloads above these sizes are serialized in a worker thread to keep the event loop responsive
+_OFFLOAD_MIN_TEXT_CHARS = 64 * 1024
+_OFFLOAD_MIN_ITEMS = 200
+
+
+async def _maybe_to_thread(offload: bool, func: Callable[..., T], *args: Any) -> T:
+    """Run synchronous pre/post-processing in a worker thread when the payload is large."""
+    if offload:
+        return await asyncio.to_thread(func, *args)
+    return func(*args)
+
+
+def _build_contract_data(data: Dict[str, Any]) -> ContractData:
+    """Build ContractData from a contract extraction response."""
+    return ContractData(**{name: data.get(key) for name, key in _CONTRACT_FIELDS})
+
+
+def _build_hardship_assessment(data: Dict[str, Any]) -> HardshipAssessment:
+    """Build the legacy HardshipAssessment from a hardship assessment response."""
+    return HardshipAssessment(
+        is_valid=data.get("assessment_result", {}).get("is_valid", False),
+        confidence=data.get("assessment_result", {}).get("confidence", 0.0),
+        reason=data.get("detailed_reasoning", "No reasoning provided"),
+        keywords_found=data.get("keywords_found", []),
+        assessment_details=data.get("hardship_analysis", {})
+    )
+
+
+def _build_hardship_prompt(
+    hardship_description: str,
+    client_context: Optional[Dict[str, Any]] = None
+) -> Dict[str, str]:
+    """Render the hardship assessment prompt."""
+    return get_hardship_assessment_prompt(
+        hardship_description=hardship_description,
+        client_age=client_context.get("age") if client_context else None,
+        family_size=client_context.get("family_size") if client_context else None,
+        employment_status=client_context.get("employment_status") if client_context else None,
+        monthly_income=client_context.get("monthly_income") if client_context else None,
+        total_debt=client_context.get("total_debt") if client_context else None
+    )
+
+
+def _hardship_cache_tag(client_context: Optional[Dict[str, Any]]) -> str:
+    """Cache tag covering every client field the hardship prompt sees, so verdicts never cross clients."""
+    context = client_context or {}
+    return json.dumps(
+        [context.get(name) for name in _HARDSHIP_CONTEXT_FIELDS], separators=(",", ":"), default=str
+    )
+
+
+def _build_budget_prompt(budget_info: Dict[str, Any]) -> Dict[str, str]:
+    """Render the budget analysis prompt."""
+    return get_budget_analysis_prompt(
+        income_details=json.dumps(budget_info.get("income", {}), separators=(",", ":")),
+        expense_details=json.dumps(budget_info.get("expenses", {}), separators=(",", ":")),
+        debt_summary=json.dumps(budget_info.get("debts", {}), separators=(",", ":")),
+        family_size=budget_info.get("family_size"),
+        location=budget_info.get("location"),
+        employment_status=budget_info.get("employment_status"),
+        credit_score=budget_info.get("credit_score")
+    )
+
+
+def _build_debt_prompt(debt_list: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Render the debt validation prompt."""
+    return get_debt_validation_prompt(
+        debt_list=json.dumps(debt_list, separators=(",", ":")),
+        creditor_database=_creditor_db_json(),
+        monthly_income="N/A",
+        client_state="N/A",
+        program_type="standard"
+    )
+
+
 class GeminiService:
     """
     Clean Gemini service using centralized prompt management.
@@ -61,13 +274,40 @@ class GeminiService:
     
     def __init__(self):
         self.llm_service = get_llm_service()
+        # Identical concurrent requests (retries, webhook storms) share one Gemini call
+        self._single_flight = SingleFlight()
         self.model_name = settings.gemini.model_name
+        # Probes are a billed LLM call, so results are reused for a short TTL
+        self._health_result: Optional[Dict[str, Any]] = None
+        self._health_checked_at = 0.0
+        
+        # Resolved once; the system prompt is static so only the user prompt is rendered per call
+        self._contract_template: Optional[PromptTemplate] = get_prompt_template("contract_extraction")
         logger.info(f"GeminiService initialized with model: {self.model_name}")
     
+    # Debt and hardship helpers are built on first use, so a process that only
+    # parses contracts never loads their reference data or cache buffers
+    @functools.cached_property
+    def creditor_matcher(self) -> CreditorMatcher:
+        """Creditor matcher used by debt validation."""
+        return get_creditor_matcher()
+    
+    @functools.cached_property
+    def hardship_classifier(self) -> HardshipClassifier:
+        """Keyword classifier that settles clear-cut hardship descriptions locally."""
+        return get_hardship_classifier()
+    
+    @functools.cached_property
+    def hardship_cache(self) -> SemanticCache:
+        """Paraphrased hardship descriptions reuse earlier assessments."""
+        return SemanticCache(max_entries=10_000, similarity_threshold=0.93)
+    
     async def parse_contract_document(self, document_text: str, document_url: str = "N/A") -> ContractData:
         """
         Parse contract document using centralized prompt management.
         
+        Concurrent calls for the same document text share one extraction.
+        
         Args:
             document_text: The full text content of the document
             document_url: URL or identifier of the document
@@ -75,37 +315,45 @@ class GeminiService:
         Returns:
             ContractData object with extracted information
         """
+        key = ("contract", hashlib.sha256(document_text.encode()).hexdigest())
+        return await self._single_flight.do(
+            key, lambda: self._parse_contract_document(document_text, document_url)
+        )
+    
+    async def _parse_contract_document(self, document_text: str, document_url: str) -> ContractData:
+        """Extract contract data from document text with a streamed Gemini call."""
         try:
-            # Use centralized prompt management
-            prompt_data = get_contract_extraction_prompt(document_text=document_text)
+            template = self._get_contract_template()
             
-            result = await self.llm_service.generate_json(
-                prompt=prompt_data["user_prompt"],
-                system_prompt=prompt_data["system_prompt"]
+            contract_text = await _maybe_to_thread(
+                len(document_text) > _OFFLOAD_MIN_TEXT_CHARS, _prepare_contract_text, document_text
             )
+            user_prompt = template.render_user_prompt(document_text=contract_text)
             
-            if not result.success:
-                logger.error(f"Contract parsing failed: {result.error}")
+            # Accumulate top-level fields as they complete in the stream
+            data: Dict[str, Any] = {}
+            try:
+                async for field_name, value in self._stream_contract_fields(user_prompt, template.system_prompt):
+                    data[field_name] = value
+            except Exception as e:
+                # A failed or cut-off stream must never yield partial contract data:
+                # redo the extraction through the retried, cached JSON path
+                logger.warning(f"Streamed contract extraction failed, retrying without streaming: {e}")
+                result = await self._generate_json(prompt=user_prompt, system_prompt=template.system_prompt)
+                if not result.success:
+                    raise ValueError(result.error)
+                data = result.data or {}
+            
+            if not data:
+                logger.error("Contract parsing failed: no JSON fields in response")
                 raise create_ai_parsing_error(
                     document_url=document_url,
                     provider="gemini",
-                    reason=f"Contract parsing failed: {result.error}"
+                    reason="Contract parsing failed: no JSON fields in response"
                 )
             
             # Convert to ContractData object
-            data = result.data or {}
-            return ContractData(
-                sender_ip=data.get("sender_ip"),
-                signer_ip=data.get("signer_ip"),
-                mailing_address=data.get("mailing_address"),
-                signatures=data.get("signatures"),
-                bank_details=data.get("bank_details"),
-                agreement=data.get("agreement"),
-                gateway=data.get("gateway"),
-                legal_plan=data.get("legal_plan"),
-                vlp_section=data.get("vlp_section"),
-                metadata=data.get("document_metadata")
-            )
+            return _build_contract_data(data)
             
         except Exception as e:
             logger.error(f"Contract parsing failed for document {document_url}: {e}")
@@ -115,6 +363,54 @@ class GeminiService:
                 reason=f"Contract parsing failed: {str(e)}"
             )
     
+    async def _generate_json(
+        self,
+        prompt: str,
+        system_prompt: str,
+        schema: Optional[Dict] = None
+    ) -> LLMResult:
+        """Call generate_json, coalescing identical concurrent requests."""
+        digest = hashlib.sha256(f"{system_prompt}\0{prompt}".encode()).hexdigest()
+        return await self._single_flight.do(
+            ("json", digest, id(schema) if schema else None),
+            lambda: self.llm_service.generate_json(prompt=prompt, system_prompt=system_prompt, schema=schema)
+        )
+    
+    def _get_contract_template(self) -> PromptTemplate:
+        """Get the contract extraction template, resolving it if it was registered after init."""
+        if self._contract_template is None:
+            self._contract_template = get_prompt_template("contract_extraction")
+            if self._contract_template is None:
+                raise ValueError("Prompt 'contract_extraction' not found")
+        return self._contract_template
+    
+    async def _stream_contract_fields(
+        self,
+        user_prompt: str,
+        system_prompt: str
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Stream the contract extraction response and yield top-level fields as they complete.
+        
+        Raises ValueError if the stream ends before the closing brace of the
+        response object, so a truncated response is never taken as complete.
+        """
+        parser = IncrementalJSONObjectParser()
+        
+        async for chunk in self.llm_service.generate_streaming(
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            temperature=0.0,
+            json_output=True
+        ):
+            for field_name, value in parser.feed(chunk):
+                yield field_name, value
+            
+            if parser.finished:
+                return
+        
+        raise ValueError("Streamed contract response ended before the JSON object was complete")
+    
     async def assess_hardship_claim(
         self, 
         hardship_description: str, 
@@ -131,40 +427,60 @@ class GeminiService:
             HardshipAssessment with validation results
         """
         try:
+            # Clear-cut claims are decided locally without an LLM call
+            local_result = self.hardship_classifier.classify(hardship_description)
+            if local_result is not None:
+                is_valid, confidence, keywords_found = local_result
+                logger.info(f"Hardship claim classified locally (confidence {confidence:.2f})")
+                return HardshipAssessment(
+                    is_valid=is_valid,
+                    confidence=confidence,
+                    reason=(
+                        f"Valid financial hardship with {len(keywords_found)} indicators"
+                        if is_valid else "No hardship description provided"
+                    ),
+                    keywords_found=keywords_found,
+                    assessment_details={"assessment_source": "local"}
+                )
+            
+            # Assessments run at temperature 0, so a near-identical description for the same
+            # client profile can reuse one; opt-in, since each miss adds an embedding call
+            cache_tag = _hardship_cache_tag(client_context)
+            embedding = None
+            if settings.cache.llm_semantic_cache_enabled:
+                embedding = await self.llm_service.embed_text(hardship_description)
+                if embedding is not None:
+                    cached = self.hardship_cache.get(embedding, tag=cache_tag)
+                    if cached is not None:
+                        return cached
+            
             # Use centralized prompt management
-            prompt_data = get_hardship_assessment_prompt(
-                hardship_description=hardship_description,
-                client_age=client_context.get("age") if client_context else None,
-                family_size=client_context.get("family_size") if client_context else None,
-                employment_status=client_context.get("employment_status") if client_context else None,
-                monthly_income=client_context.get("monthly_income") if client_context else None,
-                total_debt=client_context.get("total_debt") if client_context else None
-            )
+            prompt_data = _build_hardship_prompt(hardship_description, client_context)
             
-            result = await self.llm_service.generate_json(
+            result = await self._generate_json(
                 prompt=prompt_data["user_prompt"],
-                system_prompt=prompt_data["system_prompt"]
+                system_prompt=prompt_data["system_prompt"],
+                schema=_HARDSHIP_RESPONSE_SCHEMA
             )
             
             if not result.success:
                 logger.error(f"Hardship assessment failed: {result.error}")
+                upstream_unavailable = (result.metadata or {}).get("error_code") == "CIRCUIT_BREAKER_OPEN"
                 return HardshipAssessment(
                     is_valid=False,
                     confidence=0.0,
-                    reason=f"Assessment failed: {result.error}",
+                    reason="upstream_unavailable" if upstream_unavailable else f"Assessment failed: {result.error}",
                     keywords_found=[],
                     assessment_details={}
                 )
             
             # Return legacy format for compatibility
-            data = result.data or {}
-            return HardshipAssessment(
-                is_valid=data.get("assessment_result", {}).get("is_valid", False),
-                confidence=data.get("assessment_result", {}).get("confidence", 0.0),
-                reason=data.get("detailed_reasoning", "No reasoning provided"),
-                keywords_found=data.get("keywords_found", []),
-                assessment_details=data.get("hardship_analysis", {})
-            )
+            assessment = _build_hardship_assessment(result.data or {})
+            
+            if embedding is not None:
+                self.hardship_cache.put(embedding, assessment, tag=cache_tag)
+            
+            return assessment
             
         except Exception as e:
             logger.error(f"Hardship assessment failed: {e}")
@@ -179,17 +495,15 @@ class GeminiService:
         Analyze budget data using centralized prompt management.
         """
         try:
-            prompt_data = get_budget_analysis_prompt(
-                income_details=json.dumps(budget_info.get("income", {}), indent=2),
-                expense_details=json.dumps(budget_info.get("expenses", {}), indent=2),
-                debt_summary=json.dumps(budget_info.get("debts", {}), indent=2),
-                family_size=budget_info.get("family_size"),
-                location=budget_info.get("location"),
-                employment_status=budget_info.get("employment_status"),
-                credit_score=budget_info.get("credit_score")
+            item_count = sum(
+                len(value) for value in (budget_info.get(key) for key in ("income", "expenses", "debts"))
+                if isinstance(value, (dict, list))
+            )
+            prompt_data = await _maybe_to_thread(
+                item_count > _OFFLOAD_MIN_ITEMS, _build_budget_prompt, budget_info
             )
             
-            result = await self.llm_service.generate_json(
+            result = await self._generate_json(
                 prompt=prompt_data["user_prompt"],
                 system_prompt=prompt_data["system_prompt"]
             )
@@ -211,17 +525,30 @@ class GeminiService:
     async def validate_debt_information(self, debt_list: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Validate debt information using centralized prompt management.
+        
+        Debts whose outcome is fixed by the reference data (prohibited debt
+        types, high-risk creditors) are validated locally; only the remainder
+        is sent to Gemini, and results are merged back in the original order.
         """
         try:
-            prompt_data = get_debt_validation_prompt(
-                debt_list=json.dumps(debt_list, indent=2),
-                creditor_database="{}",  # Would be loaded from reference data
-                monthly_income="N/A",
-                client_state="N/A",
-                program_type="standard"
+            # Resolve deterministic creditor/debt-type checks locally first
+            resolved, unresolved = await _maybe_to_thread(
+                len(debt_list) > _OFFLOAD_MIN_ITEMS, self.creditor_matcher.partition, debt_list
             )
             
-            result = await self.llm_service.generate_json(
+            if not unresolved:
+                logger.info(f"Debt validation resolved locally for all {len(debt_list)} debts")
+                return {
+                    "account_validation": merge_account_validations(debt_list, resolved, []),
+                    "validation_source": "local",
+                    "creditor_database_version": _creditor_db_hash()
+                }
+            
+            prompt_data = await _maybe_to_thread(
+                len(unresolved) > _OFFLOAD_MIN_ITEMS, _build_debt_prompt, unresolved
+            )
+            
+            result = await self._generate_json(
                 prompt=prompt_data["user_prompt"],
                 system_prompt=prompt_data["system_prompt"]
             )
@@ -230,7 +557,16 @@ class GeminiService:
                 logger.error(f"Debt validation failed: {result.error}")
                 return {"error": f"Validation failed: {result.error}"}
             
-            return result.data or {}
+            # Copy: the result may be shared with coalesced concurrent callers
+            data = dict(result.data or {})
+            data["creditor_database_version"] = _creditor_db_hash()
+            if len(unresolved) < len(debt_list):
+                data["account_validation"] = merge_account_validations(
+                    debt_list, resolved, data.get("account_validation") or []
+                )
+                data["validation_source"] = "mixed"
+            
+            return data
             
         except Exception as e:
             logger.error(f"Debt validation failed: {e}")
@@ -240,8 +576,111 @@ class GeminiService:
                 reason=f"Debt validation failed: {str(e)}"
             )
     
+    async def full_validate(
+        self,
+        document_text: str,
+        hardship_description: str,
+        budget_info: Dict[str, Any],
+        debt_list: List[Dict[str, Any]],
+        client_context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run contract, hardship, budget and debt analysis in a single Gemini call.
+        
+        The four prompts are sent as delimited sections of one request, so the
+        round trip and the shared instructions are paid once. Use the
+        per-domain methods when only one analysis is needed.
+        
+        Args:
+            document_text: The full text content of the contract
+            hardship_description: The client's hardship description
+            budget_info: Income, expenses and debts for budget analysis
+            debt_list: Debts to validate
+            client_context: Additional client context for the hardship assessment
+            
+        Returns:
+            Dict with "contract" (ContractData), "hardship" (HardshipAssessment),
+            "budget" and "debts" results
+        """
+        try:
+            resolved, unresolved = self.creditor_matcher.partition(debt_list)
+            
+            contract_template = self._get_contract_template()
+            sections = {
+                "contract": {
+                    "system_prompt": contract_template.system_prompt,
+                    "user_prompt": contract_template.render_user_prompt(
+                        document_text=_prepare_contract_text(document_text)
+                    )
+                },
+                "hardship": _build_hardship_prompt(hardship_description, client_context),
+                "budget": _build_budget_prompt(budget_info)
+            }
+            if unresolved:
+                sections["debts"] = _build_debt_prompt(unresolved)
+            
+            system_prompt = "\n\n".join(
+                f"=== SECTION: {name} ===\n{prompt['system_prompt']}" for name, prompt in sections.items()
+            )
+            user_prompt = "\n\n".join(
+                f"=== SECTION: {name} ===\n{prompt['user_prompt']}" for name, prompt in sections.items()
+            )
+            user_prompt += (
+                "\n\nRespond with one JSON object whose top-level keys are "
+                f"{', '.join(json.dumps(name) for name in sections)}; each value is the JSON "
+                "requested by the section of the same name."
+            )
+            
+            result = await self._generate_json(prompt=user_prompt, system_prompt=system_prompt)
+            
+            if not result.success:
+                raise ValueError(result.error)
+            
+            data = result.data or {}
+            
+            debts = dict(data.get("debts") or {})
+            debts["creditor_database_version"] = _creditor_db_hash()
+            if len(unresolved) < len(debt_list):
+                debts["account_validation"] = merge_account_validations(
+                    debt_list, resolved, debts.get("account_validation") or []
+                )
+                debts["validation_source"] = "mixed" if unresolved else "local"
+            
+            return {
+                "contract": _build_contract_data(data.get("contract") or {}),
+                "hardship": _build_hardship_assessment(data.get("hardship") or {}),
+                "budget": data.get("budget") or {},
+                "debts": debts
+            }
+            
+        except Exception as e:
+            logger.error(f"Combined validation failed: {e}")
+            raise create_ai_parsing_error(
+                document_url="N/A",
+                provider="gemini",
+                reason=f"Combined validation failed: {str(e)}"
+            )
+    
     async def health_check(self) -> Dict[str, Any]:
-        """Check the health of the Gemini service."""
+        """
+        Check the health of the Gemini service.
+        
+        Results are cached for settings.llm.health_check_ttl seconds and
+        concurrent probes share one connection test.
+        """
+        if (
+            self._health_result is not None
+            and time.monotonic() - self._health_checked_at < settings.llm.health_check_ttl
+        ):
+            return self._health_result
+        
+        result = await self._single_flight.do(("health",), self._check_health)
+        self._health_result = result
+        self._health_checked_at = time.monotonic()
+        return result
+    
+    async def _check_health(self) -> Dict[str, Any]:
+        """Probe the LLM connection."""
         try:
             test_response = await self.llm_service.test_connection()
             
@@ -259,13 +698,19 @@ class GeminiService:
             }
 
 
-# Global Gemini service instance
+# Global service instance
 _gemini_service: Optional[GeminiService] = None
+_gemini_service_lock = threading.Lock()
 
 
 def get_gemini_service() -> GeminiService:
     """Get the global Gemini service instance."""
     global _gemini_service
+    
     if _gemini_service is None:
-        _gemini_service = GeminiService()
-    return _gemini_service 
\ No newline at end of file
+        # Double-checked so concurrent first calls build only one instance
+        with _gemini_service_lock:
+            if _gemini_service is None:
+                _gemini_service = GeminiService()
+    
+    return _gemini_service
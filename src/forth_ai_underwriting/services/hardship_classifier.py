@@ -0,0 +1,109 @@
+"""
+Local hardship classification for clear-cut hardship descriptions.
+Lets empty claims (and, when enabled, unambiguous ones) skip the Gemini assessment.
+"""
+
+import json
+import re
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+from loguru import logger
+
+from forth_ai_underwriting.config.settings import settings
+
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def load_hardship_keywords() -> List[str]:
+    """Load the hardship keywords from the reference data."""
+    try:
+        with open(DATA_DIR / "enhanced_reference_tables.json", "r") as f:
+            return json.load(f).get("hardship_keywords", [])
+    except (OSError, json.JSONDecodeError) as e:
+        logger.error(f"Failed to load hardship keywords: {e}")
+        return []
+
+
+# Negation cues; a description containing any of them is never approved locally
+_NEGATION_RE = re.compile(r"\b(?:no|not|never|none|nor|without|neither)\b|n't\b")
+
+
+class HardshipClassifier:
+    """
+    Keyword classifier for hardship descriptions.
+
+    Only clear-cut rejections are decided locally: a description with no
+    words at all (empty, whitespace or punctuation) fails without an LLM
+    call. Keyword counts cannot tell a real hardship from a negated or
+    irrelevant mention, so approval is left to the LLM unless allow_approval
+    is set, and even then any negation cue defers the claim.
+    """
+
+    def __init__(
+        self,
+        keywords: List[str],
+        allow_approval: bool = False,
+        min_approval_keywords: int = 2,
+        max_length: int = 1000
+    ):
+        self.allow_approval = allow_approval
+        self.min_approval_keywords = min_approval_keywords
+        self.max_length = max_length
+
+        # Longest keywords first so "medical bills" is preferred over "medical"
+        ordered = sorted({keyword.lower() for keyword in keywords}, key=len, reverse=True)
+        self._pattern = re.compile(
+            r"\b(?:" + "|".join(re.escape(keyword) for keyword in ordered) + r")\b"
+        ) if ordered else None
+
+    def find_keywords(self, description: str) -> List[str]:
+        """Return the distinct hardship keywords in a description, in order of appearance."""
+        if self._pattern is None:
+            return []
+        return list(dict.fromkeys(self._pattern.findall(description.lower())))
+
+    def classify(self, description: str) -> Optional[Tuple[bool, float, List[str]]]:
+        """
+        Classify a hardship description locally.
+
+        Returns:
+            Tuple of (is_valid, confidence, keywords_found), or None if the
+            description needs LLM assessment
+        """
+        text = description.strip()
+        if not any(char.isalnum() for char in text):
+            return False, 1.0, []
+
+        if not self.allow_approval or len(text) > self.max_length:
+            return None
+
+        lowered = text.lower()
+        if _NEGATION_RE.search(lowered):
+            return None
+
+        keywords_found = self.find_keywords(lowered)
+        if len(keywords_found) < self.min_approval_keywords:
+            return None
+
+        return True, 1.0 - 0.5 ** (len(keywords_found) + 1), keywords_found
+
+
+# Global hardship classifier instance
+_hardship_classifier: Optional[HardshipClassifier] = None
+_hardship_classifier_lock = threading.Lock()
+
+
+def get_hardship_classifier() -> HardshipClassifier:
+    """Get the global hardship classifier instance."""
+    global _hardship_classifier
+    if _hardship_classifier is None:
+        # Double-checked so concurrent first calls build only one instance
+        with _hardship_classifier_lock:
+            if _hardship_classifier is None:
+                _hardship_classifier = HardshipClassifier(
+                    load_hardship_keywords(),
+                    allow_approval=settings.features.hardship_local_approval
+                )
+    return _hardship_classifier
@@ -0,0 +1,236 @@
+"""
+Response caching for LLM services.
+Wraps any LLMService with an exact-match LRU and an optional semantic cache.
+"""
+
+import asyncio
+import copy
+import dataclasses
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from forth_ai_underwriting.config.settings import settings
+from forth_ai_underwriting.services.llm_service import LLMService, LLMResult
+from forth_ai_underwriting.services.semantic_cache import PersistentSemanticCache, SemanticCache, simhash
+
+try:
+    import orjson
+    
+    def _dumps_result(result: LLMResult) -> str:
+        return orjson.dumps(_result_fields(result), default=str).decode()
+    
+    _loads_result = orjson.loads
+except ImportError:
+    def _dumps_result(result: LLMResult) -> str:
+        return json.dumps(_result_fields(result), default=str)
+    
+    _loads_result = json.loads
+
+
+# Sampling above this temperature is meant to vary, so those calls are never cached
+_MAX_CACHEABLE_TEMPERATURE = 0.2
+
+# Semantic hits must also share most word 3-grams: at most this many of 64 SimHash bits may differ
+_MAX_LEXICAL_DISTANCE = 8
+
+# Prompts longer than this are SimHashed on a worker thread
+_OFFLOAD_MIN_PROMPT_CHARS = 64 * 1024
+
+
+def _result_fields(result: LLMResult) -> Dict[str, Any]:
+    """Shallow field mapping of a result; unlike dataclasses.asdict, nested data is not deep-copied."""
+    return {field.name: getattr(result, field.name) for field in dataclasses.fields(result)}
+
+
+class CachedLLMService(LLMService):
+    """
+    Caching decorator around an LLM provider.
+
+    Exact-match lookups are keyed by a SHA-256 of every request parameter.
+    When enabled, the semantic tier additionally reuses free-text results for
+    prompts whose embedding is close to an earlier one with the same system
+    prompt and parameters. JSON results carry client-specific data, so they
+    are only ever served on an exact match. Only successful results are
+    cached, and callers always receive their own copy.
+    """
+
+    def __init__(
+        self,
+        service: LLMService,
+        max_entries: Optional[int] = None,
+        semantic_enabled: Optional[bool] = None,
+        semantic_threshold: Optional[float] = None
+    ):
+        self.service = service
+        self.max_entries = max_entries or settings.cache.llm_cache_size
+        self._exact: "OrderedDict[str, LLMResult]" = OrderedDict()
+
+        if semantic_enabled is None:
+            semantic_enabled = settings.cache.llm_semantic_cache_enabled
+        self._semantic: Optional[SemanticCache] = None
+        if semantic_enabled:
+            threshold = semantic_threshold or settings.cache.llm_semantic_cache_threshold
+            if settings.cache.llm_cache_persistent:
+                self._semantic = PersistentSemanticCache(
+                    settings.cache.llm_cache_path,
+                    max_entries=self.max_entries,
+                    similarity_threshold=threshold,
+                    max_lexical_distance=_MAX_LEXICAL_DISTANCE,
+                    serialize=_dumps_result,
+                    deserialize=lambda raw: LLMResult(**_loads_result(raw))
+                )
+            else:
+                self._semantic = SemanticCache(
+                    max_entries=self.max_entries,
+                    similarity_threshold=threshold,
+                    max_lexical_distance=_MAX_LEXICAL_DISTANCE
+                )
+
+        self.hits = 0
+        self.misses = 0
+
+    async def generate_text(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> LLMResult:
+        """Generate text, serving repeated requests from the cache."""
+        effective_temperature = temperature if temperature is not None else getattr(self.service, "temperature", None)
+        if effective_temperature is not None and effective_temperature > _MAX_CACHEABLE_TEMPERATURE:
+            return await self.service.generate_text(prompt, system_prompt, temperature, max_tokens)
+
+        return await self._cached(
+            ("text", system_prompt, effective_temperature, max_tokens),
+            prompt,
+            lambda: self.service.generate_text(prompt, system_prompt, temperature, max_tokens),
+            semantic=True
+        )
+
+    async def generate_json(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        schema: Optional[Dict] = None
+    ) -> LLMResult:
+        """Generate JSON, serving exactly repeated requests from the cache."""
+        return await self._cached(
+            ("json", system_prompt, schema),
+            prompt,
+            lambda: self.service.generate_json(prompt, system_prompt, schema),
+            semantic=False
+        )
+
+    async def generate_streaming(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        json_output: bool = False
+    ) -> AsyncGenerator[str, None]:
+        """Stream from the underlying provider; streams are not cached."""
+        async for chunk in self.service.generate_streaming(
+            prompt, system_prompt, temperature=temperature, json_output=json_output
+        ):
+            yield chunk
+
+    async def test_connection(self) -> bool:
+        """Test the underlying provider's connection."""
+        return await self.service.test_connection()
+
+    async def embed_text(self, text: str) -> Optional[List[float]]:
+        """Embed text with the underlying provider."""
+        return await self.service.embed_text(text)
+
+    async def warm_up(self) -> None:
+        """Warm up the underlying provider."""
+        await self.service.warm_up()
+
+    async def close(self) -> None:
+        """Close the underlying provider and any persistent cache."""
+        if isinstance(self._semantic, PersistentSemanticCache):
+            self._semantic.close()
+        await self.service.close()
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._exact.clear()
+        if self._semantic is not None:
+            self._semantic.clear()
+
+    async def _cached(self, params: tuple, prompt: str, call, semantic: bool) -> LLMResult:
+        """Look up a request in the exact tier (and the semantic tier if allowed), calling the provider on a miss."""
+        params_key = hashlib.sha256(
+            json.dumps(params, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        key = hashlib.sha256(f"{params_key}\0{prompt}".encode()).hexdigest()
+
+        cached = self._exact.get(key)
+        if cached is not None:
+            self._exact.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(cached)
+
+        if self._semantic is None or not semantic:
+            self.misses += 1
+            result = await call()
+            if result.success:
+                self._store(key, result)
+            return result
+
+        # The embedding is needed to store the result either way, so it runs
+        # alongside the lookup and the provider call; the lookup only waits
+        # for it when some cached prompt is lexically close enough to match
+        embedding_task = asyncio.ensure_future(self.service.embed_text(prompt))
+        if len(prompt) >= _OFFLOAD_MIN_PROMPT_CHARS:
+            lexical_hash = await asyncio.to_thread(simhash, prompt)
+        else:
+            lexical_hash = simhash(prompt)
+
+        if self._semantic.has_lexical_neighbor(lexical_hash, tag=params_key):
+            embedding = await embedding_task
+            if embedding is not None:
+                cached = self._semantic.get(embedding, tag=params_key, lexical_hash=lexical_hash)
+                if cached is not None:
+                    self.hits += 1
+                    self._store(key, cached)
+                    return copy.deepcopy(cached)
+
+        self.misses += 1
+        try:
+            result = await call()
+        except BaseException:
+            embedding_task.cancel()
+            raise
+
+        if not result.success:
+            embedding_task.cancel()
+            return result
+
+        self._store(key, result)
+        embedding = await embedding_task
+        if embedding is not None:
+            self._semantic.put(embedding, copy.deepcopy(result), tag=params_key, lexical_hash=lexical_hash)
+
+        return result
+
+    def _store(self, key: str, result: LLMResult) -> None:
+        """Insert a private copy into the exact-match tier, evicting the least recently used entry."""
+        self._exact[key] = copy.deepcopy(result)
+        self._exact.move_to_end(key)
+        if len(self._exact) > self.max_entries:
+            self._exact.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._exact),
+            "semantic_entries": len(self._semantic) if self._semantic is not None else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0
+        }
@@ -3,13 +3,15 @@ LLM Service interface for AI-powered text generation.
 Clean, simple interface following SOLID principles.
 """
 
+import asyncio
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, AsyncGenerator
-from dataclasses import dataclass
+from typing import Dict, List, Optional, AsyncGenerator, Sequence
+from dataclasses import dataclass, field
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResult:
     """Result from LLM analysis."""
     success: bool
@@ -19,6 +21,18 @@ class LLMResult:
     metadata: Optional[Dict] = None
 
 
+@dataclass(frozen=True, slots=True)
+class LLMRequest:
+    """A single generation request, for batching with generate_many."""
+    prompt: str
+    system_prompt: Optional[str] = None
+    temperature: Optional[float] = None
+    max_tokens: Optional[int] = None
+    # Dicts aren't hashable: left out of the hash but still compared for equality
+    schema: Optional[Dict] = field(default=None, hash=False)
+    json_output: bool = False
+
+
 class LLMService(ABC):
     """Abstract base class for LLM services."""
     
@@ -57,7 +71,7 @@ class LLMService(ABC):
         Args:
             prompt: The user prompt
             system_prompt: Optional system/role prompt
-            schema: Optional JSON schema to validate against
+            schema: Optional JSON schema the output must conform to
             
         Returns:
             LLMResult with parsed JSON data or error
@@ -68,7 +82,9 @@ class LLMService(ABC):
     async def generate_streaming(
         self,
         prompt: str,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        json_output: bool = False
     ) -> AsyncGenerator[str, None]:
         """
         Generate text with streaming output.
@@ -76,9 +92,15 @@ class LLMService(ABC):
         Args:
             prompt: The user prompt
             system_prompt: Optional system/role prompt
+            temperature: Optional temperature override
+            json_output: Request a JSON-only response
             
         Yields:
             Chunks of generated text
+            
+        Raises:
+            Exception: If the stream fails to open or breaks off; errors are
+                never yielded as text
         """
         yield "Streaming not implemented"
     
@@ -86,10 +108,69 @@ class LLMService(ABC):
     async def test_connection(self) -> bool:
         """Test if the LLM service is accessible."""
         pass
+    
+    async def embed_text(self, text: str) -> Optional[List[float]]:
+        """
+        Embed text for semantic similarity.
+        
+        Returns:
+            Embedding vector, or None if the provider does not support embeddings
+        """
+        return None
+    
+    async def generate(self, request: LLMRequest) -> LLMResult:
+        """Run a single request through generate_json or generate_text."""
+        if request.json_output or request.schema:
+            return await self.generate_json(request.prompt, request.system_prompt, request.schema)
+        return await self.generate_text(
+            request.prompt,
+            request.system_prompt,
+            temperature=request.temperature,
+            max_tokens=request.max_tokens
+        )
+    
+    async def generate_many(
+        self,
+        requests: Sequence[LLMRequest],
+        max_concurrency: Optional[int] = None
+    ) -> List[LLMResult]:
+        """
+        Run several requests concurrently with a bound on in-flight calls.
+        
+        Args:
+            requests: Requests to run
+            max_concurrency: Optional override of the configured concurrency limit
+            
+        Returns:
+            One LLMResult per request, in request order
+        """
+        if max_concurrency is None:
+            from forth_ai_underwriting.config.settings import settings
+            max_concurrency = settings.llm.max_concurrency
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(request: LLMRequest) -> LLMResult:
+            async with semaphore:
+                return await self.generate(request)
+        
+        results = await asyncio.gather(*(run(request) for request in requests), return_exceptions=True)
+        return [
+            LLMResult(success=False, error=str(result)) if isinstance(result, Exception) else result
+            for result in results
+        ]
+    
+    async def warm_up(self) -> None:
+        """Establish connections ahead of the first request."""
+        pass
+    
+    async def close(self) -> None:
+        """Release connections held by the service."""
+        pass
 
 
 # Singleton instance holder
 _llm_service: Optional[LLMService] = None
+_llm_service_lock = threading.Lock()
 
 
 def get_llm_service() -> LLMService:
@@ -97,16 +178,39 @@ def get_llm_service() -> LLMService:
     global _llm_service
     
     if _llm_service is None:
-        # Import here to avoid circular imports
-        from forth_ai_underwriting.config.settings import settings
-        
-        # Choose implementation based on configuration
-        if settings.llm.provider == "gemini":
-            from forth_ai_underwriting.services.gemini_llm import GeminiProvider
-            _llm_service = GeminiProvider()
-        else:
-            logger.warning(f"Unknown LLM provider: {settings.llm.provider}, using Gemini as default")
-            from forth_ai_underwriting.services.gemini_llm import GeminiProvider
-            _llm_service = GeminiProvider()
+        # Double-checked so concurrent first calls build only one provider
+        with _llm_service_lock:
+            if _llm_service is None:
+                _llm_service = _create_llm_service()
+    
+    return _llm_service
+
+
+def _create_llm_service() -> LLMService:
+    """Build the LLM service selected by configuration."""
+    # Import here to avoid circular imports
+    from forth_ai_underwriting.config.settings import settings
+    
+    # Choose implementation based on configuration
+    if settings.llm.provider == "gemini":
+        from forth_ai_underwriting.services.gemini_llm import GeminiProvider
+        service = GeminiProvider()
+    else:
+        logger.warning(f"Unknown LLM provider: {settings.llm.provider}, using Gemini as default")
+        from forth_ai_underwriting.services.gemini_llm import GeminiProvider
+        service = GeminiProvider()
+    
+    if settings.cache.enable_caching:
+        from forth_ai_underwriting.services.llm_cache import CachedLLMService
+        service = CachedLLMService(service)
+    
+    return service
+
+
+async def close_llm_service() -> None:
+    """Close the global LLM service, if it was created."""
+    global _llm_service
     
-    return _llm_service 
\ No newline at end of file
+    if _llm_service is not None:
+        await _llm_service.close()
+        _llm_service = None
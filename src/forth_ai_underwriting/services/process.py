@@ -4,26 +4,33 @@ and AI-powered analysis using Gemini and other services.
 """
 
 import asyncio
-import tempfile
-import aiofiles
+import copy
+import io
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union, BinaryIO
-from dataclasses import dataclass, asdict
+from typing import TYPE_CHECKING, Dict, Any, AsyncIterator, Callable, List, Optional, Tuple, TypeVar, Union, BinaryIO
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from functools import cached_property
 from loguru import logger
 import hashlib
 import mimetypes
-from datetime import datetime
+import time
 
-# PDF processing
-import PyPDF2
-import fitz  # PyMuPDF for better text extraction
-from langchain_community.document_loaders import PyPDFLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+# PDF processing libraries are imported where used, so processes that never
+# handle a document don't load them
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF for better text extraction
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 # HTTP client for downloading documents
 import httpx
 
 from forth_ai_underwriting.config.settings import settings
+from forth_ai_underwriting.utils.http_client import get_http_client
 from forth_ai_underwriting.services.gemini_service import get_gemini_service, ContractData
 from forth_ai_underwriting.core.exceptions import (
     DocumentProcessingError,
@@ -32,22 +39,127 @@ from forth_ai_underwriting.core.exceptions import (
 )
 
 
-@dataclass
+T = TypeVar("T")
+
+# PyMuPDF output scoring at least this (e.g. 1,000 clean characters with two
+# contract keywords) is used as-is, without running the fallback extractors
+_CONFIDENT_EXTRACTION_SCORE = 1200
+
+# Lowercase keywords whose presence suggests a correctly extracted contract
+_CONTRACT_KEYWORDS = ("agreement", "contract", "signature", "payment", "terms")
+
+# PDF header signature and how far into the file it may appear
+_PDF_SIGNATURE = b"%PDF-"
+_PDF_SIGNATURE_WINDOW = 1024
+
+# Threads for blocking PDF parsing, kept apart from the default executor
+_PDF_THREAD_WORKERS = 4
+
+# Documents with at least this many pages are split across extraction processes, when enabled
+_PARALLEL_EXTRACTION_MIN_PAGES = 64
+
+# Tokens shared between consecutive text chunks
+_CHUNK_OVERLAP_TOKENS = 128
+
+# Read size for streamed document downloads
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Invisible characters stripped from extracted text before scoring
+_ASCII_CONTROL_TABLE = dict.fromkeys([*(i for i in range(32) if i not in (9, 10, 13)), 0x7F])
+_INVISIBLE_CHARS_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\x7f\xad\u200b-\u200d\u2060\ufeff]+")
+
+# Latin-1 byte values in each class, matching str.isalpha/isdigit/isspace
+_LATIN1_ALPHA = bytes(i for i in range(256) if chr(i).isalpha())
+_LATIN1_DIGIT = bytes(i for i in range(256) if chr(i).isdigit())
+_LATIN1_SPACE = bytes(i for i in range(256) if chr(i).isspace())
+
+
+@dataclass(frozen=True, slots=True)
+class _CharStats:
+    """Character class counts for a piece of text."""
+    total: int
+    alpha: int
+    digit: int
+    space: int
+    
+    @property
+    def special(self) -> int:
+        """Characters that are neither alphanumeric nor whitespace."""
+        return self.total - self.alpha - self.digit - self.space
+
+
+def _strip_invisible(text: str) -> str:
+    """
+    Remove control, soft-hyphen and zero-width characters left by PDF extraction.
+    
+    Args:
+        text: Extracted text
+        
+    Returns:
+        Text without invisible characters; tabs and line breaks are kept
+    """
+    if text.isascii():
+        # CPython's translate has a C fast path for ASCII input
+        return text.translate(_ASCII_CONTROL_TABLE)
+    return _INVISIBLE_CHARS_RE.sub("", text)
+
+
+def _char_stats(text: str) -> _CharStats:
+    """
+    Count alphabetic, digit and whitespace characters in one pass.
+    
+    Args:
+        text: Text to classify
+        
+    Returns:
+        _CharStats with the counts for each class
+    """
+    try:
+        encoded = text.encode("latin-1")
+    except UnicodeEncodeError:
+        encoded = None
+    
+    if encoded is not None:
+        # One byte per character: deleting a class's bytes in C leaves its count as the length difference
+        size = len(encoded)
+        return _CharStats(
+            total=len(text),
+            alpha=size - len(encoded.translate(None, _LATIN1_ALPHA)),
+            digit=size - len(encoded.translate(None, _LATIN1_DIGIT)),
+            space=size - len(encoded.translate(None, _LATIN1_SPACE))
+        )
+    
+    alpha = digit = space = 0
+    for c in text:
+        if c.isalpha():
+            alpha += 1
+        elif c.isdigit():
+            digit += 1
+        elif c.isspace():
+            space += 1
+    return _CharStats(total=len(text), alpha=alpha, digit=digit, space=space)
+
+
+@dataclass(slots=True)
 class DocumentInfo:
-    """Document metadata and processing information."""
+    """Document metadata and processing information; the text itself is on ProcessingResult."""
     url: str
     filename: str
     file_size: int
     mime_type: str
     page_count: int
+    content_hash: Optional[str] = None
     processing_status: str = "pending"
-    extracted_text: Optional[str] = None
+    text_length: int = 0
     text_quality: str = "unknown"
     processing_time_ms: Optional[int] = None
     error_message: Optional[str] = None
+    # Held only between download and text extraction
+    _pdf_doc: Optional["fitz.Document"] = field(default=None, init=False, repr=False, compare=False)
+    _pdf_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Complete document processing result."""
     document_info: DocumentInfo
@@ -70,15 +182,37 @@ class DocumentProcessor:
     
     def __init__(self):
         self.gemini_service = get_gemini_service()
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=settings.document_processing.max_chunk_size * 100,  # Convert to reasonable chunk size
-            chunk_overlap=200,
-            length_function=len
+        
+        # Completed results keyed by (content SHA-256, skip_ai_parsing)
+        self._result_cache: "OrderedDict[Tuple[str, bool], ProcessingResult]" = OrderedDict()
+        self._result_cache_size = (
+            settings.cache.document_cache_size if settings.cache.enable_caching else 0
         )
-        self.http_client = httpx.AsyncClient(timeout=settings.document_processing.processing_timeout)
         
         logger.info("DocumentProcessor initialized")
     
+    @cached_property
+    def text_splitter(self) -> "RecursiveCharacterTextSplitter":
+        """
+        Splitter sizing chunks in tokens (MAX_CHUNK_SIZE) rather than characters.
+        
+        Built on first use, since loading the tokenizer is not free. cl100k_base
+        only approximates Gemini's tokenizer, but it tracks it far more closely
+        than a character count does.
+        """
+        from langchain_text_splitters import RecursiveCharacterTextSplitter
+        
+        return RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+            encoding_name="cl100k_base",
+            chunk_size=settings.document_processing.max_chunk_size,
+            chunk_overlap=_CHUNK_OVERLAP_TOKENS
+        )
+    
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client used for document downloads."""
+        return get_http_client()
+    
     async def process_document(
         self, 
         document_url: str, 
@@ -96,7 +230,7 @@ class DocumentProcessor:
         Returns:
             ProcessingResult with all extracted information
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter_ns()
         processing_errors = []
         
         try:
@@ -105,9 +239,24 @@ class DocumentProcessor:
             # Step 1: Download and validate document
             document_info = await self._download_and_validate(document_url, document_name)
             
+            # Same bytes seen before: reuse the earlier result, skipping extraction and AI parsing
+            cache_key = (document_info.content_hash, skip_ai_parsing)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._release_pdf(document_info)
+                self._result_cache.move_to_end(cache_key)
+                processing_time = (time.perf_counter_ns() - start_time) // 1_000_000
+                logger.info(f"Reusing processing result for identical content: {document_info.content_hash[:12]}")
+                return _copy_result(
+                    cached,
+                    url=document_url,
+                    filename=document_info.filename,
+                    processing_time_ms=processing_time
+                )
+            
             # Step 2: Extract text from PDF
             extracted_text = await self._extract_text_from_pdf(document_info)
-            document_info.extracted_text = extracted_text
+            document_info.text_length = len(extracted_text)
             document_info.text_quality = self._assess_text_quality(extracted_text)
             
             # Step 3: AI-powered parsing (if enabled)
@@ -122,8 +271,8 @@ class DocumentProcessor:
                         document_url
                     )
                     
-                    # Extract document metadata
-                    metadata = await self.gemini_service.extract_document_metadata(extracted_text)
+                    # Document metadata comes back with the same extraction call
+                    metadata = contract_data.metadata
                     
                     logger.info("AI parsing completed successfully")
                     
@@ -133,8 +282,8 @@ class DocumentProcessor:
                     logger.error(error_msg)
             
             # Calculate processing time
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
-            document_info.processing_time_ms = int(processing_time)
+            processing_time = (time.perf_counter_ns() - start_time) // 1_000_000
+            document_info.processing_time_ms = processing_time
             document_info.processing_status = "completed" if not processing_errors else "completed_with_errors"
             
             # Determine if document is ready for validation
@@ -153,15 +302,18 @@ class DocumentProcessor:
                 processing_errors=processing_errors
             )
             
+            if not processing_errors:
+                self._cache_result(cache_key, result)
+            
             logger.info(
-                f"Document processing completed in {processing_time:.0f}ms. "
+                f"Document processing completed in {processing_time}ms. "
                 f"Validation ready: {validation_ready}"
             )
             
             return result
             
         except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            processing_time = (time.perf_counter_ns() - start_time) // 1_000_000
             error_msg = f"Document processing failed: {str(e)}"
             logger.error(error_msg)
             
@@ -174,7 +326,7 @@ class DocumentProcessor:
                     mime_type="unknown",
                     page_count=0,
                     processing_status="failed",
-                    processing_time_ms=int(processing_time),
+                    processing_time_ms=processing_time,
                     error_message=error_msg
                 ),
                 processing_errors=[error_msg],
@@ -186,44 +338,50 @@ class DocumentProcessor:
         try:
             logger.info(f"Downloading document from: {document_url}")
             
-            # Download the document
-            response = await self.http_client.get(document_url)
-            response.raise_for_status()
+            max_size = settings.document_processing.max_file_size_mb * 1024 * 1024
             
-            # Extract filename
-            if not document_name:
-                document_name = Path(document_url).name or "document.pdf"
+            # Stream the download so oversized files are rejected without buffering them
+            async with self.http_client.stream(
+                "GET",
+                document_url,
+                timeout=settings.document_processing.processing_timeout
+            ) as response:
+                response.raise_for_status()
+                
+                # Extract filename
+                if not document_name:
+                    document_name = Path(document_url).name or "document.pdf"
+                
+                # Determine mime type
+                mime_type = response.headers.get("content-type", "application/octet-stream")
+                if not mime_type or mime_type == "application/octet-stream":
+                    mime_type = mimetypes.guess_type(document_name)[0] or "application/pdf"
+                
+                # Validate file size, up front when the server declares it
+                content_length = response.headers.get("content-length")
+                if content_length and content_length.isdigit():
+                    self._check_file_size(int(content_length), max_size)
+                
+                buffer = bytearray()
+                async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                    buffer += chunk
+                    self._check_file_size(len(buffer), max_size)
             
-            # Determine mime type
-            mime_type = response.headers.get("content-type", "application/octet-stream")
-            if not mime_type or mime_type == "application/octet-stream":
-                mime_type = mimetypes.guess_type(document_name)[0] or "application/pdf"
+            content = bytes(buffer)
+            file_size = len(content)
             
-            # Validate file type
-            if not self._is_supported_file_type(mime_type, document_name):
+            # Validate file type from the content itself; headers and names are caller-controlled
+            if not self._is_pdf(content):
                 raise DocumentProcessingError(
-                    f"Unsupported file type: {mime_type}",
+                    f"Unsupported file type: content is not a PDF (declared {mime_type})",
                     error_code="UNSUPPORTED_FILE_TYPE",
                     details={"mime_type": mime_type, "filename": document_name}
                 )
             
-            # Validate file size
-            file_size = len(response.content)
-            max_size = settings.document_processing.max_file_size_mb * 1024 * 1024
-            if file_size > max_size:
-                raise DocumentProcessingError(
-                    f"File too large: {file_size} bytes (max: {max_size})",
-                    error_code="FILE_TOO_LARGE",
-                    details={"file_size": file_size, "max_size": max_size}
-                )
-            
-            # Save to temporary file for processing
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-            async with aiofiles.open(temp_file.name, "wb") as f:
-                await f.write(response.content)
+            # Parse the PDF once; the open document is reused for extraction
+            pdf_doc = await _run_pdf_work(self._open_pdf, content)
             
-            # Get page count
-            page_count = await self._get_pdf_page_count(temp_file.name)
+            page_count = pdf_doc.page_count if pdf_doc is not None else 0
             
             document_info = DocumentInfo(
                 url=document_url,
@@ -231,11 +389,13 @@ class DocumentProcessor:
                 file_size=file_size,
                 mime_type=mime_type,
                 page_count=page_count,
+                content_hash=hashlib.sha256(content).hexdigest(),
                 processing_status="downloaded"
             )
             
-            # Store temp file path for later processing
-            document_info._temp_file_path = temp_file.name
+            # Keep the document in memory for later processing
+            document_info._pdf_doc = pdf_doc
+            document_info._pdf_bytes = content
             
             logger.info(f"Document downloaded: {file_size} bytes, {page_count} pages")
             return document_info
@@ -253,34 +413,34 @@ class DocumentProcessor:
     
     async def _extract_text_from_pdf(self, document_info: DocumentInfo) -> str:
         """Extract text from PDF using multiple methods for best quality."""
-        temp_file_path = getattr(document_info, '_temp_file_path', None)
-        if not temp_file_path:
-            raise DocumentProcessingError("No temporary file available for text extraction")
+        pdf_bytes = document_info._pdf_bytes
+        if not pdf_bytes:
+            raise DocumentProcessingError("No document content available for text extraction")
+        pdf_doc = document_info._pdf_doc
         
         try:
             logger.info(f"Extracting text from PDF: {document_info.filename}")
             
             # Method 1: Try PyMuPDF first (usually better for complex PDFs)
-            text_pymupdf = await self._extract_with_pymupdf(temp_file_path)
-            
-            # Method 2: Try PyPDF2 as fallback
-            text_pypdf2 = await self._extract_with_pypdf2(temp_file_path)
-            
-            # Method 3: Try LangChain PyPDFLoader
-            text_langchain = await self._extract_with_langchain(temp_file_path)
-            
-            # Choose the best extraction result
-            extracted_text = self._choose_best_extraction([
-                ("pymupdf", text_pymupdf),
-                ("pypdf2", text_pypdf2), 
-                ("langchain", text_langchain)
-            ])
+            if pdf_doc is not None and self._use_parallel_extraction(pdf_doc.page_count):
+                text_pymupdf = await self._extract_with_pymupdf_parallel(pdf_bytes, pdf_doc.page_count)
+            else:
+                text_pymupdf = await _run_pdf_work(self._extract_with_pymupdf, pdf_doc)
+            text_pymupdf = _strip_invisible(text_pymupdf)
             
-            # Clean up temporary file
-            try:
-                Path(temp_file_path).unlink()
-            except Exception:
-                pass  # Ignore cleanup errors
+            if self._score_extraction(text_pymupdf) >= _CONFIDENT_EXTRACTION_SCORE:
+                # Good enough on its own; skip the slower pure-Python fallbacks
+                logger.info("Using PyMuPDF extraction without fallbacks")
+                extracted_text = text_pymupdf
+            else:
+                # Method 2: Try PyPDF2 as fallback
+                text_pypdf2 = _strip_invisible(await _run_pdf_work(self._extract_with_pypdf2, pdf_bytes))
+                
+                # Choose the best extraction result
+                extracted_text = self._choose_best_extraction([
+                    ("pymupdf", text_pymupdf),
+                    ("pypdf2", text_pypdf2)
+                ])
             
             if not extracted_text or len(extracted_text.strip()) < 50:
                 raise DocumentProcessingError("Insufficient text extracted from PDF")
@@ -294,51 +454,94 @@ class DocumentProcessor:
                 document_id=document_info.url,
                 reason=f"Text extraction failed: {str(e)}"
             )
+        finally:
+            self._release_pdf(document_info)
     
-    async def _extract_with_pymupdf(self, file_path: str) -> str:
-        """Extract text using PyMuPDF."""
+    def _release_pdf(self, document_info: DocumentInfo) -> None:
+        """Close the parsed document and drop the raw bytes held for extraction."""
+        pdf_doc = document_info._pdf_doc
+        if pdf_doc is not None:
+            pdf_doc.close()
+        document_info._pdf_doc = None
+        document_info._pdf_bytes = None
+    
+    def _cache_result(self, key: Tuple[str, bool], result: ProcessingResult) -> None:
+        """Remember a completed result, evicting the least recently used entry."""
+        if self._result_cache_size <= 0:
+            return
+        # Stored and handed out as copies, so callers mutating a result can't alter the cache
+        self._result_cache[key] = _copy_result(result)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self._result_cache_size:
+            self._result_cache.popitem(last=False)
+    
+    def _extract_with_pymupdf(self, doc: Optional["fitz.Document"]) -> str:
+        """Extract text from an open PyMuPDF document (blocking; run off the event loop)."""
+        if doc is None:
+            return ""
+        
         try:
-            doc = fitz.open(file_path)
             text_parts = []
             
-            for page_num in range(doc.page_count):
-                page = doc[page_num]
+            for page in doc:
                 text_parts.append(page.get_text())
             
-            doc.close()
             return "\n".join(text_parts)
             
         except Exception as e:
             logger.warning(f"PyMuPDF extraction failed: {e}")
             return ""
     
-    async def _extract_with_pypdf2(self, file_path: str) -> str:
-        """Extract text using PyPDF2."""
+    def _use_parallel_extraction(self, page_count: int) -> bool:
+        """
+        Whether a document is large enough to extract across worker processes.
+        
+        Needs at least two workers: with PDF_EXTRACTION_PROCESSES at 0 or 1
+        extraction stays in-process, since one worker would only add overhead.
+        """
+        return (
+            settings.document_processing.extraction_processes > 1 and
+            page_count >= _PARALLEL_EXTRACTION_MIN_PAGES
+        )
+    
+    async def _extract_with_pymupdf_parallel(self, content: bytes, page_count: int) -> str:
+        """
+        Extract text with PyMuPDF, splitting the pages across worker processes.
+        
+        MuPDF is not thread-safe and holds the GIL, so page ranges go to
+        separate processes, each opening its own copy of the document.
+        """
         try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                text_parts = []
-                
-                for page in pdf_reader.pages:
-                    text_parts.append(page.extract_text())
-                
-                return "\n".join(text_parts)
-                
+            workers = settings.document_processing.extraction_processes
+            step = -(-page_count // workers)
+            loop = asyncio.get_running_loop()
+            pool = _get_extraction_pool()
+            
+            parts = await asyncio.gather(*(
+                loop.run_in_executor(pool, _extract_page_range, content, start, min(start + step, page_count))
+                for start in range(0, page_count, step)
+            ))
+            return "\n".join(parts)
+            
         except Exception as e:
-            logger.warning(f"PyPDF2 extraction failed: {e}")
+            logger.warning(f"Parallel PyMuPDF extraction failed: {e}")
             return ""
     
-    async def _extract_with_langchain(self, file_path: str) -> str:
-        """Extract text using LangChain PyPDFLoader."""
+    def _extract_with_pypdf2(self, content: bytes) -> str:
+        """Extract text using PyPDF2 (blocking; run off the event loop)."""
         try:
-            loader = PyPDFLoader(file_path)
-            pages = await asyncio.get_event_loop().run_in_executor(None, loader.load)
+            import PyPDF2
             
-            text_parts = [page.page_content for page in pages]
-            return "\n".join(text_parts)
+            pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+            text_parts = []
             
+            for page in pdf_reader.pages:
+                text_parts.append(page.extract_text())
+            
+            return "\n".join(text_parts)
+                
         except Exception as e:
-            logger.warning(f"LangChain extraction failed: {e}")
+            logger.warning(f"PyPDF2 extraction failed: {e}")
             return ""
     
     def _choose_best_extraction(self, extractions: List[tuple]) -> str:
@@ -350,19 +553,7 @@ class DocumentProcessor:
             if not text:
                 continue
                 
-            # Simple scoring based on length and quality indicators
-            score = len(text)
-            
-            # Bonus for containing common contract keywords
-            contract_keywords = ["agreement", "contract", "signature", "payment", "terms"]
-            keyword_count = sum(1 for keyword in contract_keywords if keyword.lower() in text.lower())
-            score += keyword_count * 100
-            
-            # Penalty for too many special characters (indicates poor extraction)
-            special_char_ratio = sum(1 for c in text if not c.isalnum() and not c.isspace()) / max(len(text), 1)
-            if special_char_ratio > 0.3:
-                score *= 0.5
-            
+            score = self._score_extraction(text)
             scored_extractions.append((score, method, text))
         
         if not scored_extractions:
@@ -374,28 +565,48 @@ class DocumentProcessor:
         
         return best_text
     
-    async def _get_pdf_page_count(self, file_path: str) -> int:
-        """Get the number of pages in a PDF."""
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                return len(pdf_reader.pages)
-        except Exception:
-            return 0
-    
-    def _is_supported_file_type(self, mime_type: str, filename: str) -> bool:
-        """Check if the file type is supported."""
-        supported_types = [
-            "application/pdf",
-            "application/x-pdf",
-        ]
+    def _score_extraction(self, text: str) -> float:
+        """Score an extraction result; higher is better."""
+        if not text:
+            return 0.0
         
-        supported_extensions = [".pdf"]
+        # Simple scoring based on length and quality indicators
+        score = len(text)
         
-        return (
-            mime_type in supported_types or
-            any(filename.lower().endswith(ext) for ext in supported_extensions)
-        )
+        # Bonus for containing common contract keywords
+        text_lower = text.lower()
+        keyword_count = sum(1 for keyword in _CONTRACT_KEYWORDS if keyword in text_lower)
+        score += keyword_count * 100
+        
+        # Penalty for too many special characters (indicates poor extraction)
+        special_char_ratio = _char_stats(text).special / len(text)
+        if special_char_ratio > 0.3:
+            score *= 0.5
+        
+        return float(score)
+    
+    def _check_file_size(self, file_size: int, max_size: int) -> None:
+        """Raise if a download exceeds the configured size limit."""
+        if file_size > max_size:
+            raise DocumentProcessingError(
+                f"File too large: {file_size} bytes (max: {max_size})",
+                error_code="FILE_TOO_LARGE",
+                details={"file_size": file_size, "max_size": max_size}
+            )
+    
+    def _open_pdf(self, content: bytes) -> Optional["fitz.Document"]:
+        """Parse PDF bytes with PyMuPDF, or return None if they cannot be opened."""
+        try:
+            import fitz
+            
+            return fitz.open(stream=content, filetype="pdf")
+        except Exception as e:
+            logger.warning(f"PyMuPDF could not open document: {e}")
+            return None
+    
+    def _is_pdf(self, content: bytes) -> bool:
+        """Check for the PDF header signature, which readers accept anywhere in the first 1 KB."""
+        return content.find(_PDF_SIGNATURE, 0, _PDF_SIGNATURE_WINDOW) != -1
     
     def _assess_text_quality(self, text: str) -> str:
         """Assess the quality of extracted text."""
@@ -404,16 +615,14 @@ class DocumentProcessor:
         
         # Calculate various quality metrics
         total_chars = len(text)
-        alpha_chars = sum(1 for c in text if c.isalpha())
-        digit_chars = sum(1 for c in text if c.isdigit())
-        space_chars = sum(1 for c in text if c.isspace())
-        
         if total_chars < 100:
             return "poor"
         
+        stats = _char_stats(text)
+        
         # Calculate ratios
-        alpha_ratio = alpha_chars / total_chars
-        readable_ratio = (alpha_chars + digit_chars + space_chars) / total_chars
+        alpha_ratio = stats.alpha / total_chars
+        readable_ratio = (stats.alpha + stats.digit + stats.space) / total_chars
         
         # Quality assessment
         if readable_ratio > 0.8 and alpha_ratio > 0.3:
@@ -431,35 +640,63 @@ class DocumentProcessor:
         """Process multiple documents concurrently."""
         semaphore = asyncio.Semaphore(max_concurrent)
         
-        async def process_with_semaphore(url: str) -> ProcessingResult:
-            async with semaphore:
-                return await self.process_document(url)
+        # Per-document failures become error results; anything else cancels the batch
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [
+                task_group.create_task(self._process_with_limit(url, semaphore))
+                for url in document_urls
+            ]
+        
+        return [task.result() for task in tasks]
+    
+    async def iter_processed_documents(
+        self,
+        document_urls: List[str],
+        max_concurrent: int = 3
+    ) -> AsyncIterator[ProcessingResult]:
+        """
+        Process multiple documents concurrently, yielding results as they finish.
         
-        tasks = [process_with_semaphore(url) for url in document_urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        Args:
+            document_urls: URLs of the documents to process
+            max_concurrent: Maximum number of documents processed at once
+            
+        Yields:
+            ProcessingResult for each document, in completion order
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+        tasks = [
+            asyncio.ensure_future(self._process_with_limit(url, semaphore))
+            for url in document_urls
+        ]
         
-        # Convert exceptions to error results
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                error_result = ProcessingResult(
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # Consumer stopped early or failed: don't leave documents processing
+            for task in tasks:
+                task.cancel()
+    
+    async def _process_with_limit(self, url: str, semaphore: asyncio.Semaphore) -> ProcessingResult:
+        """Process one document under a concurrency limit, converting errors to a failed result."""
+        async with semaphore:
+            try:
+                return await self.process_document(url)
+            except Exception as e:
+                return ProcessingResult(
                     document_info=DocumentInfo(
-                        url=document_urls[i],
+                        url=url,
                         filename="unknown",
                         file_size=0,
                         mime_type="unknown",
                         page_count=0,
                         processing_status="failed",
-                        error_message=str(result)
+                        error_message=str(e)
                     ),
                     validation_ready=False,
-                    processing_errors=[str(result)]
+                    processing_errors=[str(e)]
                 )
-                processed_results.append(error_result)
-            else:
-                processed_results.append(result)
-        
-        return processed_results
     
     async def health_check(self) -> Dict[str, Any]:
         """Check the health of the document processor."""
@@ -491,19 +728,104 @@ class DocumentProcessor:
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        await self.http_client.aclose()
+        """Async context manager exit; the shared HTTP client is closed at application shutdown."""
+        pass
+
+
+def _copy_result(result: ProcessingResult, **document_changes: Any) -> ProcessingResult:
+    """Copy a processing result deeply enough that the copy shares no mutable state."""
+    return replace(
+        result,
+        document_info=replace(result.document_info, **document_changes),
+        contract_data=copy.deepcopy(result.contract_data),
+        metadata=copy.deepcopy(result.metadata),
+        processing_errors=list(result.processing_errors)
+    )
+
+
+def _extract_page_range(content: bytes, start: int, stop: int) -> str:
+    """Extract text from pages [start, stop) of a PDF; runs in an extraction worker process."""
+    import fitz
+    
+    with fitz.open(stream=content, filetype="pdf") as doc:
+        return "\n".join(doc[page_num].get_text() for page_num in range(start, stop))
+
+
+# Dedicated thread pool for blocking PDF parsing
+_pdf_executor: Optional[ThreadPoolExecutor] = None
+_pdf_executor_lock = threading.Lock()
+
+# Process pool for page-parallel extraction
+_extraction_pool: Optional[ProcessPoolExecutor] = None
+_extraction_pool_lock = threading.Lock()
+
+
+def _get_pdf_executor() -> ThreadPoolExecutor:
+    """Get the PDF thread pool, creating it on first use."""
+    global _pdf_executor
+    if _pdf_executor is None:
+        # Double-checked so concurrent first calls build only one pool
+        with _pdf_executor_lock:
+            if _pdf_executor is None:
+                _pdf_executor = ThreadPoolExecutor(
+                    max_workers=_PDF_THREAD_WORKERS,
+                    thread_name_prefix="pdf-worker"
+                )
+    return _pdf_executor
+
+
+async def _run_pdf_work(func: Callable[..., T], *args: Any) -> T:
+    """
+    Run blocking PDF work on the dedicated PDF thread pool.
+    
+    Long parses stay off the default executor, which other libraries
+    use for short blocking calls such as DNS lookups.
+    """
+    return await asyncio.get_running_loop().run_in_executor(_get_pdf_executor(), func, *args)
+
+
+def _get_extraction_pool() -> ProcessPoolExecutor:
+    """Get the extraction process pool, creating it on first use."""
+    global _extraction_pool
+    if _extraction_pool is None:
+        # Double-checked so concurrent first calls build only one pool
+        with _extraction_pool_lock:
+            if _extraction_pool is None:
+                # Spawned rather than forked: the parent runs threads that fork would copy mid-lock
+                _extraction_pool = ProcessPoolExecutor(
+                    max_workers=settings.document_processing.extraction_processes,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+    return _extraction_pool
+
+
+def shutdown_extraction_pools() -> None:
+    """Shut down the PDF thread pool and extraction process pool, if they were created."""
+    global _pdf_executor, _extraction_pool
+    with _pdf_executor_lock:
+        if _pdf_executor is not None:
+            _pdf_executor.shutdown(cancel_futures=True)
+            _pdf_executor = None
+    with _extraction_pool_lock:
+        if _extraction_pool is not None:
+            _extraction_pool.shutdown(cancel_futures=True)
+            _extraction_pool = None
+    logger.info("PDF extraction pools shut down")
 
 
 # Global document processor instance
 _document_processor: Optional[DocumentProcessor] = None
+_document_processor_lock = threading.Lock()
 
 
 def get_document_processor() -> DocumentProcessor:
     """Get the global document processor instance."""
     global _document_processor
     if _document_processor is None:
-        _document_processor = DocumentProcessor()
+        # Double-checked so concurrent first calls build only one instance
+        with _document_processor_lock:
+            if _document_processor is None:
+                _document_processor = DocumentProcessor()
     return _document_processor
 
 
@@ -0,0 +1,295 @@
+"""
+Semantic response cache keyed by text embeddings.
+Reuses results for inputs that are paraphrases of ones already answered.
+"""
+
+import json
+import re
+import sqlite3
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, List, Optional, Sequence, Union
+
+import numpy as np
+from loguru import logger
+
+
+# Rows allocated for the first entry; the matrix doubles as the cache fills
+_INITIAL_CAPACITY = 64
+
+_TOKEN_RE = re.compile(r"\w+")
+_SHINGLE_SIZE = 3
+_CRC_SEED = 0x9E3779B9  # Seeds the second CRC so the two 32-bit halves are independent
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def simhash(text: str) -> int:
+    """
+    Compute a 64-bit SimHash over a text's word shingles.
+
+    Texts sharing most of their word 3-grams get hashes a small Hamming
+    distance apart, which makes it a cheap lexical-overlap check.
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    shingles = {" ".join(tokens[i:i + _SHINGLE_SIZE]) for i in range(max(1, len(tokens) - _SHINGLE_SIZE + 1))}
+    hashes = np.fromiter(
+        (zlib.crc32(shingle) | zlib.crc32(shingle, _CRC_SEED) << 32 for shingle in map(str.encode, shingles)),
+        dtype=np.uint64,
+        count=len(shingles)
+    )
+    bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    majority = bits.sum(axis=0, dtype=np.int64) * 2 > len(shingles)
+    return int(np.packbits(majority, bitorder="little").view(np.uint64)[0])
+
+
+class SemanticCache:
+    """
+    In-memory cosine-similarity cache with LRU eviction.
+
+    Embeddings are normalized and stored in a contiguous float32 matrix, so a
+    lookup is one matrix-vector product. The matrix grows by doubling up to
+    ``max_entries`` rows instead of being allocated at full size. Each entry
+    carries an optional tag that must also match on lookup (e.g. a context
+    field that changes the answer).
+
+    With ``max_lexical_distance`` set, entries also carry a SimHash of their
+    text and only entries within that Hamming distance of the query's hash
+    can match, so near-identical embeddings of texts that differ in a key
+    term are not confused.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        similarity_threshold: float = 0.93,
+        max_lexical_distance: Optional[int] = None
+    ):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.max_lexical_distance = max_lexical_distance
+
+        self._matrix: Optional[np.ndarray] = None
+        self._lexical = np.zeros(max_entries, dtype=np.uint64)
+        self._values: List[Any] = [None] * max_entries
+        self._tags: List[Optional[Hashable]] = [None] * max_entries
+        self._lru: "OrderedDict[int, None]" = OrderedDict()  # slot -> None, least recently used first
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def get(
+        self,
+        embedding: Sequence[float],
+        tag: Optional[Hashable] = None,
+        lexical_hash: Optional[int] = None
+    ) -> Optional[Any]:
+        """
+        Return the cached value most similar to an embedding, if above the threshold.
+
+        Args:
+            embedding: Query embedding
+            tag: Tag the cached entry must have
+            lexical_hash: SimHash of the query text, required when lexical filtering is enabled
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        if not self._size:
+            return None
+
+        query = self._normalize(embedding)
+        if query is None or query.shape[0] != self._matrix.shape[1]:
+            return None
+
+        similarities = self._matrix[:self._size] @ query
+        eligible = similarities >= self.similarity_threshold
+        if self.max_lexical_distance is not None:
+            if lexical_hash is None:
+                return None
+            eligible &= self._lexical_distances(lexical_hash) <= self.max_lexical_distance
+
+        candidates = np.flatnonzero(eligible)
+        for slot in candidates[np.argsort(-similarities[candidates])]:
+            slot = int(slot)
+            if slot in self._lru and self._tags[slot] == tag:
+                self._lru.move_to_end(slot)
+                logger.debug("Semantic cache hit (similarity {:.3f})", similarities[slot])
+                return self._values[slot]
+
+        return None
+
+    def has_lexical_neighbor(self, lexical_hash: int, tag: Optional[Hashable] = None) -> bool:
+        """
+        Check whether any entry is lexically close enough to possibly match.
+
+        A False result means get() is certain to miss, so the caller can skip
+        computing the query embedding for the lookup.
+        """
+        if not self._size:
+            return False
+        if self.max_lexical_distance is None:
+            return True
+
+        close = np.flatnonzero(self._lexical_distances(lexical_hash) <= self.max_lexical_distance)
+        return any(int(slot) in self._lru and self._tags[int(slot)] == tag for slot in close)
+
+    def put(
+        self,
+        embedding: Sequence[float],
+        value: Any,
+        tag: Optional[Hashable] = None,
+        lexical_hash: Optional[int] = None
+    ) -> None:
+        """Store a value under an embedding, evicting the least recently used entry when full."""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        if self._matrix is None:
+            self._matrix = np.empty((min(self.max_entries, _INITIAL_CAPACITY), vector.shape[0]), dtype=np.float32)
+        elif vector.shape[0] != self._matrix.shape[1]:
+            logger.warning("Semantic cache embedding dimension changed; ignoring entry")
+            return
+
+        if self._size < self.max_entries:
+            slot = self._size
+            if slot == self._matrix.shape[0]:
+                self._grow()
+            self._size += 1
+        else:
+            slot, _ = self._lru.popitem(last=False)
+
+        self._matrix[slot] = vector
+        self._lexical[slot] = lexical_hash or 0
+        self._values[slot] = value
+        self._tags[slot] = tag
+        self._lru[slot] = None
+
+    def _lexical_distances(self, lexical_hash: int) -> np.ndarray:
+        """Hamming distances from a SimHash to every stored entry's hash."""
+        differing = self._lexical[:self._size] ^ np.uint64(lexical_hash)
+        return _POPCOUNT[differing.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+    def _grow(self) -> None:
+        """Double the matrix capacity, up to max_entries rows."""
+        rows, dim = self._matrix.shape
+        grown = np.empty((min(self.max_entries, rows * 2), dim), dtype=np.float32)
+        grown[:rows] = self._matrix
+        self._matrix = grown
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._matrix = None
+        self._lexical[:] = 0
+        self._values = [None] * self.max_entries
+        self._tags = [None] * self.max_entries
+        self._lru.clear()
+        self._size = 0
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> Optional[np.ndarray]:
+        """Convert an embedding to a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if vector.ndim != 1 or norm == 0.0:
+            return None
+        return vector / norm
+
+
+class PersistentSemanticCache(SemanticCache):
+    """
+    Semantic cache whose entries survive process restarts.
+
+    Entries are written through to a SQLite file as float32 embedding blobs
+    next to the serialized value, and the most recent ``max_entries`` rows
+    are loaded back into the in-memory matrix on startup, so lookups stay a
+    single matrix-vector product. Tags must be strings (or None).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: int = 10_000,
+        similarity_threshold: float = 0.93,
+        max_lexical_distance: Optional[int] = None,
+        serialize: Callable[[Any], str] = json.dumps,
+        deserialize: Callable[[str], Any] = json.loads
+    ):
+        super().__init__(
+            max_entries=max_entries,
+            similarity_threshold=similarity_threshold,
+            max_lexical_distance=max_lexical_distance
+        )
+        self.path = Path(path)
+        self._serialize = serialize
+        self._deserialize = deserialize
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS semantic_cache ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, tag TEXT, embedding BLOB NOT NULL, "
+            "value TEXT NOT NULL, created REAL NOT NULL, lexical_hash INTEGER)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(semantic_cache)")}
+        if "lexical_hash" not in columns:
+            self._conn.execute("ALTER TABLE semantic_cache ADD COLUMN lexical_hash INTEGER")
+        self._conn.commit()
+        self._load()
+
+    def put(
+        self,
+        embedding: Sequence[float],
+        value: Any,
+        tag: Optional[str] = None,
+        lexical_hash: Optional[int] = None
+    ) -> None:
+        """Store a value in memory and on disk, trimming the oldest rows beyond max_entries."""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        super().put(vector, value, tag, lexical_hash)
+        # SQLite integers are signed 64-bit
+        stored_hash = None if lexical_hash is None else int(np.uint64(lexical_hash).view(np.int64))
+        try:
+            cursor = self._conn.execute(
+                "INSERT INTO semantic_cache (tag, embedding, value, created, lexical_hash) VALUES (?, ?, ?, ?, ?)",
+                (tag, vector.tobytes(), self._serialize(value), time.time(), stored_hash)
+            )
+            self._conn.execute(
+                "DELETE FROM semantic_cache WHERE id <= ?",
+                (cursor.lastrowid - self.max_entries,)
+            )
+            self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Failed to persist semantic cache entry: {e}")
+
+    def clear(self) -> None:
+        """Remove all entries, including persisted ones."""
+        super().clear()
+        self._conn.execute("DELETE FROM semantic_cache")
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def _load(self) -> None:
+        """Load the most recent persisted entries into memory, oldest first."""
+        rows = self._conn.execute(
+            "SELECT tag, embedding, value, lexical_hash FROM semantic_cache ORDER BY id DESC LIMIT ?",
+            (self.max_entries,)
+        ).fetchall()
+        for tag, blob, value, stored_hash in reversed(rows):
+            lexical_hash = None if stored_hash is None else int(np.int64(stored_hash).view(np.uint64))
+            try:
+                super().put(np.frombuffer(blob, dtype=np.float32), self._deserialize(value), tag, lexical_hash)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Skipping unreadable semantic cache entry: {e}")
+
+        if rows:
+            logger.info(f"Loaded {len(self)} semantic cache entries from {self.path}")
@@ -19,26 +19,22 @@ class TeamsBot:
         """
         Formats validation results into a human-readable string for Teams.
         """
-        formatted_output = ["📊 **Underwriting Validation Results**\n"]
+        header = "📊 **Underwriting Validation Results**\n"
+        if not results:
+            return header
         
-        passed_count = 0
+        body = "\n".join(
+            f"{'✅' if result.result == 'Pass' else '❌'} **{result.title}** ---- {result.result} ---- {result.reason}"
+            for result in results
+        )
+        passed_count = sum(result.result == "Pass" for result in results)
         total_count = len(results)
+        success_rate = (passed_count / total_count) * 100
         
-        for result in results:
-            status_icon = "✅" if result.result == "Pass" else "❌"
-            formatted_output.append(
-                f"{status_icon} **{result.title}** ---- {result.result} ---- {result.reason}"
-            )
-            if result.result == "Pass":
-                passed_count += 1
-        
-        if total_count > 0:
-            success_rate = (passed_count / total_count) * 100
-            formatted_output.append(
-                f"\n📈 **Summary**: Passed {passed_count}/{total_count} checks ({success_rate:.1f}% success rate)"
-            )
-        
-        return "\n".join(formatted_output)
+        return (
+            f"{header}\n{body}\n"
+            f"\n📈 **Summary**: Passed {passed_count}/{total_count} checks ({success_rate:.1f}% success rate)"
+        )
     
     async def send_message(self, conversation_id: str, message: str):
         """
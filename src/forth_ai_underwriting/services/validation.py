@@ -12,6 +12,7 @@ from loguru import logger
 from dateutil.parser import parse as parse_date
 
 from forth_ai_underwriting.config.settings import settings
+from forth_ai_underwriting.utils.http_client import get_http_client
 from forth_ai_underwriting.core.schemas import ValidationResult
 from forth_ai_underwriting.services.gemini_service import get_gemini_service
 from forth_ai_underwriting.core.exceptions import ValidationError, ExternalAPIError
@@ -69,16 +70,18 @@ class ForthAPIClient:
     """Client for Forth API interactions."""
     
     def __init__(self):
-        self.client = httpx.AsyncClient(
-            base_url=settings.forth_api.base_url,
-            headers={"Authorization": f"Bearer {settings.forth_api.api_key}"},
-            timeout=settings.forth_api.timeout
-        )
+        self.base_url = settings.forth_api.base_url.rstrip("/")
+        self.headers = {"Authorization": f"Bearer {settings.forth_api.api_key}"}
+        self.timeout = settings.forth_api.timeout
     
     async def fetch_contact_data(self, contact_id: str) -> Dict[str, Any]:
         """Fetch contact data from Forth API."""
         try:
-            response = await self.client.get(f"/contacts/{contact_id}")
+            response = await get_http_client().get(
+                f"{self.base_url}/contacts/{contact_id}",
+                headers=self.headers,
+                timeout=self.timeout
+            )
             response.raise_for_status()
             return response.json()
         except httpx.RequestError as e:
@@ -92,7 +95,8 @@ class ForthAPIClient:
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        # Connections belong to the shared pool, closed at application shutdown
+        pass
 
 
 class ValidationService:
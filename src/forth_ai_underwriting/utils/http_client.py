@@ -0,0 +1,52 @@
+"""
+Shared outbound HTTP connection pool.
+"""
+
+import importlib.util
+from typing import Optional
+
+import httpx
+from loguru import logger
+
+from forth_ai_underwriting.config.settings import settings
+
+
+# Global HTTP client instance
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide HTTP client.
+
+    Services share one connection pool so keep-alive connections (and their
+    TLS sessions) are reused across services instead of per client instance.
+    Callers pass base URLs, headers and timeouts per request and must not
+    close the client themselves.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        http2 = settings.http.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but the h2 package is not installed; using HTTP/1.1")
+            http2 = False
+        
+        _http_client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.http.max_connections,
+                max_keepalive_connections=settings.http.max_keepalive_connections,
+                keepalive_expiry=settings.http.keepalive_expiry
+            ),
+            timeout=httpx.Timeout(settings.http.timeout)
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client, if it was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        logger.info("Shared HTTP client closed")
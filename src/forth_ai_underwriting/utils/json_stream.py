@@ -0,0 +1,89 @@
+"""
+Incremental JSON parsing utilities for streamed LLM output.
+"""
+
+import json
+from typing import Any, List, Tuple
+
+
+class IncrementalJSONObjectParser:
+    """
+    Push parser that emits top-level members of a JSON object as soon as they complete.
+
+    Text before the opening brace (e.g. a markdown code fence) is ignored, so the
+    parser can be fed raw model output chunk by chunk.
+    """
+
+    def __init__(self):
+        self._member: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._started = False
+        self._finished = False
+
+    @property
+    def finished(self) -> bool:
+        """Whether the closing brace of the top-level object has been seen."""
+        return self._finished
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Feed a chunk of text and return any top-level members completed by it.
+
+        Args:
+            chunk: Next piece of streamed text
+
+        Returns:
+            List of (key, value) pairs in document order
+        """
+        completed = []
+
+        for char in chunk:
+            if self._finished:
+                break
+
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                self._member.append(char)
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+
+            if self._depth == 1 and char == ",":
+                completed.extend(self._flush_member())
+            elif self._depth == 0:
+                completed.extend(self._flush_member())
+                self._finished = True
+            else:
+                self._member.append(char)
+
+        return completed
+
+    def _flush_member(self) -> List[Tuple[str, Any]]:
+        """Decode the buffered `"key": value` segment, if any."""
+        segment = "".join(self._member).strip()
+        self._member = []
+        if not segment:
+            return []
+
+        try:
+            return list(json.loads("{" + segment + "}").items())
+        except json.JSONDecodeError:
+            return []
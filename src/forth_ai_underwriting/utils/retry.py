@@ -5,11 +5,15 @@ Retry utilities for resilient API calls and operations.
 import asyncio
 import functools
 import logging
+import time
+from collections import deque
 from typing import Any, Callable, Optional, Type, Union, Tuple
 from tenacity import (
     retry, 
     stop_after_attempt, 
     wait_exponential, 
+    wait_exponential_jitter,
+    retry_if_exception,
     retry_if_exception_type,
     before_sleep_log,
     after_log
@@ -25,6 +29,7 @@ def retry_api_call(
     wait_min: float = 1.0,
     wait_max: float = 60.0,
     wait_multiplier: float = 2.0,
+    jitter: bool = False,
     retry_on_exceptions: Tuple[Type[Exception], ...] = (
         ConnectionError,
         TimeoutError,
@@ -34,7 +39,9 @@ def retry_api_call(
         RateLimitError,
         ValueError,
         TypeError,
-    )
+    ),
+    honor_stop_on: bool = False,
+    reraise: bool = False
 ):
     """
     Decorator for retrying API calls with exponential backoff.
@@ -44,8 +51,14 @@ def retry_api_call(
         wait_min: Minimum wait time between retries (seconds)
         wait_max: Maximum wait time between retries (seconds)
         wait_multiplier: Multiplier for exponential backoff
+        jitter: Add up to wait_min seconds of random jitter to each wait
         retry_on_exceptions: Exceptions that should trigger a retry
-        stop_on_exceptions: Exceptions that should stop retries immediately
+        stop_on_exceptions: Exceptions that should stop retries immediately;
+            only applied when honor_stop_on is set
+        honor_stop_on: Never retry stop_on_exceptions, even when they subclass
+            one of retry_on_exceptions (off by default for existing callers)
+        reraise: Raise the last exception once attempts run out instead of
+            tenacity.RetryError (off by default for existing callers)
     """
     
     def should_retry(exception):
@@ -54,16 +67,30 @@ def retry_api_call(
             return False
         return isinstance(exception, retry_on_exceptions)
     
-    return retry(
-        stop=stop_after_attempt(max_attempts),
-        wait=wait_exponential(
+    if jitter:
+        wait = wait_exponential_jitter(
+            initial=wait_min,
+            max=wait_max,
+            exp_base=wait_multiplier,
+            jitter=wait_min
+        )
+    else:
+        wait = wait_exponential(
             multiplier=wait_multiplier,
             min=wait_min,
             max=wait_max
+        )
+    
+    return retry(
+        stop=stop_after_attempt(max_attempts),
+        wait=wait,
+        retry=(
+            retry_if_exception(should_retry) if honor_stop_on
+            else retry_if_exception_type(retry_on_exceptions)
         ),
-        retry=retry_if_exception_type(retry_on_exceptions),
         before_sleep=before_sleep_log(logger, logging.WARNING),
-        after=after_log(logger, logging.INFO)
+        after=after_log(logger, logging.INFO),
+        reraise=reraise
     )
 
 
@@ -119,22 +146,35 @@ def retry_async_operation(
 class CircuitBreaker:
     """
     Circuit breaker pattern for protecting against cascading failures.
+    
+    The circuit opens after ``failure_threshold`` failures without an
+    intervening success. With ``failure_window`` set, those failures must
+    also fall within that many seconds, so sporadic errors spread over a
+    long period never open it.
     """
     
     def __init__(
         self,
         failure_threshold: int = 5,
         recovery_timeout: float = 60.0,
-        expected_exception: Type[Exception] = Exception
+        expected_exception: Type[Exception] = Exception,
+        failure_window: Optional[float] = None
     ):
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.expected_exception = expected_exception
+        self.failure_window = failure_window
         
-        self.failure_count = 0
+        # Monotonic timestamps of the most recent failures
+        self._failures: deque = deque(maxlen=failure_threshold)
         self.last_failure_time = None
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
     
+    @property
+    def failure_count(self) -> int:
+        """Number of recent failures counted towards opening the circuit."""
+        return len(self._failures)
+    
     def __call__(self, func: Callable) -> Callable:
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
@@ -166,26 +206,30 @@ class CircuitBreaker:
         if self.last_failure_time is None:
             return True
         
-        import time
-        return (time.time() - self.last_failure_time) >= self.recovery_timeout
+        return (time.monotonic() - self.last_failure_time) >= self.recovery_timeout
     
     def _on_success(self):
         """Reset the circuit breaker on successful operation."""
-        self.failure_count = 0
+        self._failures.clear()
         self.state = "CLOSED"
     
     def _on_failure(self):
         """Handle failure and potentially open the circuit."""
-        import time
-        
-        self.failure_count += 1
-        self.last_failure_time = time.time()
+        now = time.monotonic()
+        self._failures.append(now)
+        self.last_failure_time = now
         
-        if self.failure_count >= self.failure_threshold:
+        if self.state == "HALF_OPEN" or self._threshold_reached(now):
             self.state = "OPEN"
             logger.warning(
                 f"Circuit breaker opened after {self.failure_count} failures"
             )
+    
+    def _threshold_reached(self, now: float) -> bool:
+        """Check whether enough recent failures have accumulated to open the circuit."""
+        if len(self._failures) < self.failure_threshold:
+            return False
+        return self.failure_window is None or now - self._failures[0] <= self.failure_window
 
 
 # Pre-configured retry decorators for common scenarios
@@ -197,10 +241,14 @@ retry_forth_api = retry_api_call(
 )
 
 retry_ai_api = retry_api_call(
-    max_attempts=2,
-    wait_min=2.0,
-    wait_max=60.0,
-    retry_on_exceptions=(ConnectionError, TimeoutError, ExternalAPIError)
+    max_attempts=3,
+    wait_min=0.5,
+    wait_max=8.0,
+    jitter=True,
+    retry_on_exceptions=(ConnectionError, TimeoutError, ExternalAPIError),
+    # Callers build LLMResult error codes from the original exception
+    honor_stop_on=True,
+    reraise=True
 )
 
 retry_database = retry_api_call(
@@ -4,12 +4,56 @@ import os
 import json
 import tempfile
 import logging
+from functools import lru_cache
 from typing import Dict, Optional
-import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+
+# boto3 is only needed to fetch secrets; the credential-file helpers work without it
+try:
+    import boto3
+    from botocore.config import Config
+    from botocore.exceptions import ClientError, NoCredentialsError
+    _HAS_BOTO3 = True
+except ImportError:
+    _HAS_BOTO3 = False
 
 logger = logging.getLogger(__name__)
 
+# Secrets are fetched a few at a time at startup; a small pool is enough and
+# adaptive retries back off client-side when Secrets Manager throttles. Short
+# connect timeouts keep an unreachable endpoint from stalling startup for the
+# botocore default of 60s, and keep-alive lets consecutive fetches share a connection
+_SECRETS_CLIENT_CONFIG = {
+    "max_pool_connections": 4,
+    "retries": {"max_attempts": 3, "mode": "adaptive"},
+    "tcp_keepalive": True,
+    "connect_timeout": 3,
+    "read_timeout": 30,
+}
+
+
+@lru_cache(maxsize=None)
+def _get_secrets_client(region_name: str):
+    """
+    Get the Secrets Manager client for a region.
+    
+    Clients are created once per region and shared, so the database and
+    Gemini secrets are fetched over the same connection pool.
+    
+    Args:
+        region_name: AWS region of the client
+        
+    Returns:
+        boto3 Secrets Manager client
+    """
+    # Use environment variables for AWS credentials
+    session = boto3.session.Session()
+    return session.client(
+        service_name='secretsmanager',
+        region_name=region_name,
+        config=Config(**_SECRETS_CLIENT_CONFIG)
+    )
+
+
 def get_aws_secret(secret_name: str, region_name: str = "us-west-1") -> Dict:
     """
     Retrieve a secret from AWS Secrets Manager.
@@ -25,14 +69,13 @@ def get_aws_secret(secret_name: str, region_name: str = "us-west-1") -> Dict:
         ClientError: If AWS API call fails
         ValueError: If secret format is invalid
         NoCredentialsError: If AWS credentials are not configured
+        ImportError: If boto3 is not installed
     """
+    if not _HAS_BOTO3:
+        raise ImportError("boto3 is required to read secrets from AWS Secrets Manager")
+    
     try:
-        # Use environment variables for AWS credentials
-        session = boto3.session.Session()
-        client = session.client(
-            service_name='secretsmanager',
-            region_name=region_name
-        )
+        client = _get_secrets_client(region_name)
         
         logger.info(f"Fetching secret: {secret_name} from region: {region_name}")
         
@@ -186,7 +229,7 @@ def cleanup_temp_credentials(temp_path: str) -> None:
     try:
         if temp_path and os.path.exists(temp_path):
             os.unlink(temp_path)
-            logger.debug(f"Cleaned up temporary credentials file: {temp_path}")
+            logger.debug("Cleaned up temporary credentials file: %s", temp_path)
     except Exception as e:
         logger.warning(f"Failed to cleanup temp credentials file {temp_path}: {e}")
 
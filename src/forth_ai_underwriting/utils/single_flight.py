@@ -0,0 +1,57 @@
+"""
+Single-flight coalescing of duplicate concurrent async calls.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls that share a key into one execution.
+
+    The first caller for a key runs the call; callers arriving while it is in
+    flight await the same future and receive its result or exception. The key
+    is released as soon as the call completes, so later calls run again.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run func once per key among concurrent callers.
+
+        Args:
+            key: Identity of the call
+            func: Zero-argument coroutine factory performing the call
+
+        Returns:
+            The result shared by all callers with this key
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            # Shield so a cancelled follower does not cancel the shared call
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved; followers (if any) still receive it
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    def __len__(self) -> int:
+        return len(self._inflight)
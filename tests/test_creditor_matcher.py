@@ -0,0 +1,73 @@
+import pytest
+
+from forth_ai_underwriting.services.creditor_matcher import (
+    CreditorMatcher,
+    merge_account_validations,
+    normalize_creditor_name,
+)
+
+
+@pytest.fixture
+def matcher():
+    return CreditorMatcher({
+        "high_risk_creditors": ["Cashnet USA", "GS Bank/Apple Card Services", "Rocket Loans"],
+        "unacceptable_debt_types": ["payday_loans"],
+        "minimum_debt_per_creditor": 500,
+    })
+
+
+def test_normalize_strips_punctuation_and_corporate_suffixes():
+    assert normalize_creditor_name("Bank of America, N.A.") == "BANK OF AMERICA"
+    assert normalize_creditor_name("cashnet usa, LLC") == "CASHNET USA"
+
+
+def test_match_high_risk_handles_aliases_and_near_misses(matcher):
+    assert matcher.match_high_risk("Apple Card Services") == ("GS Bank/Apple Card Services", 1.0)
+    assert matcher.match_high_risk("Rocket Loan")[0] == "Rocket Loans"
+    assert matcher.match_high_risk("Chase") == (None, 0.0)
+
+
+def test_match_high_risk_ignores_unreviewed_name_fragments(matcher):
+    assert matcher.match_high_risk("GS Bank") == (None, 0.0)
+    assert matcher.match_high_risk("Apple") == (None, 0.0)
+
+
+def test_partition_leaves_ambiguous_debts_for_llm(matcher):
+    debts = [
+        {"creditor_name": "Chase", "debt_amount": 5000},
+        {"creditor_name": "Cashnet USA Inc", "debt_amount": 300},
+        {"creditor_name": "Quick Cash", "debt_type": "payday_loans", "debt_amount": 900},
+    ]
+
+    resolved, unresolved = matcher.partition(debts)
+
+    assert unresolved == [debts[0]]
+    assert resolved[0] is None
+    assert resolved[1]["status"] == "conditional"
+    assert "Debt amount below $500 minimum" in resolved[1]["concerns"]
+    assert resolved[2]["status"] == "prohibited"
+
+    merged = merge_account_validations(debts, resolved, [{"creditor_name": "Chase", "status": "acceptable"}])
+    assert [entry["creditor_name"] for entry in merged] == ["Chase", "Cashnet USA Inc", "Quick Cash"]
+
+
+def test_merge_matches_llm_entries_by_account_not_position():
+    debts = [
+        {"creditor_name": "Chase", "debt_amount": 5000},
+        {"creditor_name": "Cashnet USA", "debt_amount": 900},
+        {"creditor_name": "Discover", "debt_amount": 1200},
+        {"creditor_name": "Chase", "debt_amount": 700},
+    ]
+    resolved = [None, {"creditor_name": "Cashnet USA", "status": "conditional"}, None, None]
+    llm_entries = [
+        {"creditor_name": "CHASE", "debt_amount": 700, "status": "acceptable"},
+        {"creditor_name": "Discover", "debt_amount": 1200, "status": "acceptable"},
+        {"creditor_name": "Chase", "debt_amount": 5000, "status": "review"},
+        {"creditor_name": "Unknown", "status": "review"},
+    ]
+
+    merged = merge_account_validations(debts, resolved, llm_entries)
+
+    assert [(entry["creditor_name"], entry.get("debt_amount")) for entry in merged] == [
+        ("Chase", 5000), ("Cashnet USA", None), ("Discover", 1200), ("CHASE", 700), ("Unknown", None)
+    ]
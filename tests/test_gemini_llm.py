@@ -0,0 +1,55 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from forth_ai_underwriting.core.exceptions import ExternalAPIError
+from forth_ai_underwriting.services import gemini_llm
+from forth_ai_underwriting.services.gemini_llm import GeminiProvider
+
+
+async def test_embed_text_uses_blocking_sdk_call_off_the_event_loop(monkeypatch):
+    calls = []
+
+    def embed_content(model, content, task_type=None, title=None):
+        calls.append((model, content, task_type, threading.current_thread()))
+        return {"embedding": [0.1, 0.2, 0.3]}
+
+    # google-generativeai 0.3.2 exposes only the synchronous embed_content
+    monkeypatch.setattr(gemini_llm, "genai", SimpleNamespace(embed_content=embed_content))
+    provider = GeminiProvider.__new__(GeminiProvider)
+    provider.embedding_model = "models/embedding-001"
+
+    embedding = await provider.embed_text("lost my job")
+
+    assert embedding == [0.1, 0.2, 0.3]
+    (model, content, task_type, thread), = calls
+    assert (model, content, task_type) == ("models/embedding-001", "lost my job", "semantic_similarity")
+    assert thread is not threading.main_thread()
+
+
+async def test_generate_streaming_raises_when_the_stream_breaks():
+    class BrokenStream:
+        def __aiter__(self):
+            return self._chunks()
+
+        async def _chunks(self):
+            yield SimpleNamespace(candidates=[1], parts=[1], text='{"sender_ip": ')
+            raise google_exceptions.ServiceUnavailable("connection reset")
+
+    class Model:
+        async def generate_content_async(self, prompt, generation_config=None, stream=False):
+            assert stream
+            return BrokenStream()
+
+    provider = GeminiProvider.__new__(GeminiProvider)
+    provider.model = Model()
+    provider.temperature = 0.1
+    provider.max_tokens = 1024
+
+    chunks = []
+    with pytest.raises(ExternalAPIError):
+        async for chunk in provider.generate_streaming("prompt", json_output=True):
+            chunks.append(chunk)
+    assert chunks == ['{"sender_ip": ']
@@ -0,0 +1,53 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from forth_ai_underwriting.services.gemini_service import GeminiService
+from forth_ai_underwriting.services.llm_service import LLMResult
+
+
+CONTRACT_JSON = '{"sender_ip": "10.0.0.1", "signer_ip": "10.0.0.2", "bank_details": {"routing_number": "021000021"}}'
+
+
+class TruncatedStreamLLM:
+    """Streams the first fields of a contract response, then stops mid-object."""
+
+    def __init__(self, json_result):
+        self.json_result = json_result
+        self.json_calls = 0
+
+    async def generate_streaming(self, prompt, system_prompt=None, temperature=None, json_output=False):
+        yield '```json\n{"sender_ip": "10.0.0.1", '
+        yield '"signer_ip": "10.0.0.2", "bank_details": {"routing'
+
+    async def generate_json(self, prompt, system_prompt=None, schema=None):
+        self.json_calls += 1
+        return self.json_result
+
+
+def _service(llm):
+    service = GeminiService()
+    service.llm_service = llm
+    service._contract_template = SimpleNamespace(
+        system_prompt="Extract contract fields.",
+        render_user_prompt=lambda document_text: document_text
+    )
+    return service
+
+
+async def test_truncated_contract_stream_falls_back_to_full_extraction():
+    llm = TruncatedStreamLLM(LLMResult(success=True, data=json.loads(CONTRACT_JSON)))
+
+    contract = await _service(llm).parse_contract_document("Contract text", "doc-1")
+
+    assert llm.json_calls == 1
+    assert contract.signer_ip == "10.0.0.2"
+    assert contract.bank_details == {"routing_number": "021000021"}
+
+
+async def test_truncated_contract_stream_is_never_returned_as_success():
+    llm = TruncatedStreamLLM(LLMResult(success=False, error="upstream unavailable"))
+
+    with pytest.raises(Exception, match="upstream unavailable"):
+        await _service(llm).parse_contract_document("Contract text", "doc-2")
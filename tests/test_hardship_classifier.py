@@ -0,0 +1,38 @@
+from forth_ai_underwriting.services.hardship_classifier import HardshipClassifier
+
+
+KEYWORDS = ["medical", "medical bills", "lost job", "job loss", "divorce", "reduced hours"]
+
+
+def test_classify_rejects_descriptions_without_words():
+    classifier = HardshipClassifier(KEYWORDS)
+
+    assert classifier.classify("") == (False, 1.0, [])
+    assert classifier.classify("  ...  ") == (False, 1.0, [])
+
+
+def test_classify_defers_approval_to_llm_by_default():
+    classifier = HardshipClassifier(KEYWORDS)
+
+    assert classifier.classify("I lost job in March and the medical bills from my surgery piled up") is None
+    assert classifier.classify("Divorce") is None
+
+
+def test_classify_approves_strong_descriptions_when_enabled():
+    classifier = HardshipClassifier(KEYWORDS, allow_approval=True)
+
+    result = classifier.classify("I lost job in March and the medical bills from my surgery piled up")
+
+    assert result is not None
+    is_valid, probability, keywords_found = result
+    assert is_valid
+    assert probability > 0.85
+    assert keywords_found == ["lost job", "medical bills"]
+    assert classifier.classify("Going through a divorce and money is tight") is None
+
+
+def test_classify_never_approves_negated_descriptions():
+    classifier = HardshipClassifier(KEYWORDS, allow_approval=True)
+
+    assert classifier.classify("no medical bills, no job loss") is None
+    assert classifier.classify("I haven't had medical bills or a divorce") is None
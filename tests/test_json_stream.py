@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from forth_ai_underwriting.utils.json_stream import IncrementalJSONObjectParser
+
+
+CONTRACT_RESPONSE = {
+    "sender_ip": "192.168.1.100",
+    "signatures": {"applicant": "John \"JD\" Doe, Jr.", "co_applicant": None},
+    "gateway": {"payment_amount": 300.0, "dates": ["2025-01-01", "2025-01-15"]},
+    "vlp_section": {"present": True},
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 10_000])
+def test_parser_emits_all_fields_regardless_of_chunking(chunk_size):
+    text = "```json\n" + json.dumps(CONTRACT_RESPONSE, indent=2) + "\n```"
+    parser = IncrementalJSONObjectParser()
+
+    fields = []
+    for i in range(0, len(text), chunk_size):
+        fields.extend(parser.feed(text[i:i + chunk_size]))
+
+    assert dict(fields) == CONTRACT_RESPONSE
+    assert [name for name, _ in fields] == list(CONTRACT_RESPONSE)
+    assert parser.finished
+
+
+def test_parser_emits_fields_before_object_closes():
+    parser = IncrementalJSONObjectParser()
+
+    assert parser.feed('{"sender_ip": "10.0.0.1", "signatures": {"appl') == [("sender_ip", "10.0.0.1")]
+    assert parser.feed('icant": "Jane"}}') == [("signatures", {"applicant": "Jane"})]
+    assert parser.finished
+
+
+def test_parser_ignores_truncated_trailing_field():
+    parser = IncrementalJSONObjectParser()
+
+    assert parser.feed('{"sender_ip": "10.0.0.1", "signer_ip": "10.0') == [("sender_ip", "10.0.0.1")]
+    assert not parser.finished
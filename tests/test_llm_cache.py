@@ -0,0 +1,91 @@
+from forth_ai_underwriting.services.llm_cache import CachedLLMService
+from forth_ai_underwriting.services.llm_service import LLMResult, LLMService
+
+
+class FakeLLMService(LLMService):
+    temperature = 0.1
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_text(self, prompt, system_prompt=None, temperature=None, max_tokens=None):
+        self.calls += 1
+        return LLMResult(success=True, content=f"{prompt}:{self.calls}")
+
+    async def generate_json(self, prompt, system_prompt=None, schema=None):
+        self.calls += 1
+        if prompt == "fail":
+            return LLMResult(success=False, error="boom")
+        return LLMResult(success=True, data={"calls": self.calls})
+
+    async def generate_streaming(self, prompt, system_prompt=None, temperature=None, json_output=False):
+        yield prompt
+
+    async def test_connection(self):
+        return True
+
+    async def embed_text(self, text):
+        return [1.0, 0.0] if "loan" in text else [0.0, 1.0]
+
+
+async def test_exact_hit_skips_provider():
+    inner = FakeLLMService()
+    service = CachedLLMService(inner, max_entries=8, semantic_enabled=False)
+
+    first = await service.generate_json("prompt", schema={"type": "object"})
+    second = await service.generate_json("prompt", schema={"type": "object"})
+    other_schema = await service.generate_json("prompt", schema={"type": "array"})
+
+    assert second == first and second is not first
+    assert other_schema.data == {"calls": 2}
+    assert inner.calls == 2
+
+
+async def test_cached_results_are_copies():
+    inner = FakeLLMService()
+    service = CachedLLMService(inner, max_entries=8, semantic_enabled=False)
+
+    first = await service.generate_json("prompt")
+    first.data["calls"] = 99
+    second = await service.generate_json("prompt")
+    second.data["calls"] = 42
+
+    assert (await service.generate_json("prompt")).data == {"calls": 1}
+
+
+async def test_failures_and_hot_temperatures_are_not_cached():
+    inner = FakeLLMService()
+    service = CachedLLMService(inner, max_entries=8, semantic_enabled=False)
+
+    await service.generate_json("fail")
+    await service.generate_json("fail")
+    await service.generate_text("story", temperature=0.9)
+    await service.generate_text("story", temperature=0.9)
+
+    assert inner.calls == 4
+
+
+TEMPLATE = " ".join(f"instruction{i}" for i in range(80))
+
+
+async def test_semantic_hit_requires_similar_embedding_and_text():
+    inner = FakeLLMService()
+    service = CachedLLMService(inner, max_entries=8, semantic_enabled=True, semantic_threshold=0.9)
+
+    first = await service.generate_text(f"{TEMPLATE} describe the loan")
+    similar = await service.generate_text(f"{TEMPLATE} describe this loan")
+    unrelated_text = await service.generate_text("a short loan question")
+
+    assert similar == first
+    assert unrelated_text != first
+    assert inner.calls == 2
+
+
+async def test_semantic_tier_never_serves_json():
+    inner = FakeLLMService()
+    service = CachedLLMService(inner, max_entries=8, semantic_enabled=True, semantic_threshold=0.9)
+
+    await service.generate_json(f"{TEMPLATE} budget for the loan client A")
+    other_client = await service.generate_json(f"{TEMPLATE} budget for the loan client B")
+
+    assert other_client.data == {"calls": 2}
@@ -0,0 +1,51 @@
+import asyncio
+
+from forth_ai_underwriting.services.llm_service import LLMRequest, LLMResult, LLMService
+
+
+class SlowLLMService(LLMService):
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+
+    async def generate_text(self, prompt, system_prompt=None, temperature=None, max_tokens=None):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if prompt == "fail":
+            raise RuntimeError("boom")
+        return LLMResult(success=True, content=prompt)
+
+    async def generate_json(self, prompt, system_prompt=None, schema=None):
+        return LLMResult(success=True, data={"prompt": prompt})
+
+    async def generate_streaming(self, prompt, system_prompt=None, temperature=None, json_output=False):
+        yield prompt
+
+    async def test_connection(self):
+        return True
+
+
+async def test_generate_many_bounds_concurrency_and_keeps_order():
+    service = SlowLLMService()
+    requests = [LLMRequest(prompt=str(i)) for i in range(10)]
+    requests.append(LLMRequest(prompt="fail"))
+    requests.append(LLMRequest(prompt="json", json_output=True))
+
+    results = await service.generate_many(requests, max_concurrency=3)
+
+    assert [result.content for result in results[:10]] == [str(i) for i in range(10)]
+    assert not results[10].success and results[10].error == "boom"
+    assert results[11].data == {"prompt": "json"}
+    assert service.peak == 3
+
+
+def test_llm_request_with_schema_is_hashable():
+    schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+    first = LLMRequest(prompt="p", schema=schema)
+    second = LLMRequest(prompt="p", schema=dict(schema))
+
+    assert first == second
+    assert len({first, second}) == 1
+    assert first != LLMRequest(prompt="p", schema={"type": "object"})
@@ -0,0 +1,57 @@
+import pytest
+
+from forth_ai_underwriting.services.gemini_service import ContractData
+from forth_ai_underwriting.services.process import (
+    DocumentInfo,
+    ProcessingResult,
+    _char_stats,
+    _copy_result,
+    _strip_invisible,
+)
+
+
+@pytest.mark.parametrize("text", [
+    "Payment terms: 12 monthly installments\tof $250.00\n",
+    "Débiteur: Zoë Müller, Straße § 4, ² 42 ¥",
+    "Débiteur: Zoë Müller ² 42 €",
+])
+def test_char_stats_matches_str_predicates(text):
+    stats = _char_stats(text)
+
+    assert stats.total == len(text)
+    assert stats.alpha == sum(c.isalpha() for c in text)
+    assert stats.digit == sum(c.isdigit() for c in text)
+    assert stats.space == sum(c.isspace() for c in text)
+    assert stats.special == sum(not c.isalnum() and not c.isspace() for c in text)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Pay\x00ment\x0c terms\r\n\tdue", "Payment terms\r\n\tdue"),
+    ("Agree\xadmen\u200bt\ufeff é", "Agreement é"),
+])
+def test_strip_invisible_keeps_tabs_and_line_breaks(text, expected):
+    assert _strip_invisible(text) == expected
+
+
+def test_copy_result_shares_no_mutable_state():
+    result = ProcessingResult(
+        document_info=DocumentInfo(
+            url="https://example.com/a.pdf", filename="a.pdf", file_size=10,
+            mime_type="application/pdf", page_count=1
+        ),
+        contract_data=ContractData(bank_details={"routing_number": "123"}),
+        metadata={"extraction_confidence": "high"},
+    )
+
+    copied = _copy_result(result, url="https://example.com/b.pdf")
+    copied.document_info.processing_status = "completed"
+    copied.contract_data.bank_details["routing_number"] = "999"
+    copied.metadata["extraction_confidence"] = "low"
+    copied.processing_errors.append("boom")
+
+    assert copied.document_info.url == "https://example.com/b.pdf"
+    assert result.document_info.url == "https://example.com/a.pdf"
+    assert result.document_info.processing_status == "pending"
+    assert result.contract_data.bank_details == {"routing_number": "123"}
+    assert result.metadata == {"extraction_confidence": "high"}
+    assert result.processing_errors == []
@@ -0,0 +1,77 @@
+import pytest
+from tenacity import RetryError
+
+from forth_ai_underwriting.core.exceptions import ExternalAPIError, RateLimitError
+from forth_ai_underwriting.utils import retry
+from forth_ai_underwriting.utils.retry import CircuitBreaker, retry_api_call
+
+
+async def test_circuit_breaker_only_counts_failures_within_window(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(retry.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker(
+        failure_threshold=3,
+        recovery_timeout=30.0,
+        expected_exception=ExternalAPIError,
+        failure_window=60.0
+    )
+
+    @breaker
+    async def fail():
+        raise ExternalAPIError("boom")
+
+    for timestamp in (0.0, 50.0, 111.0, 130.0):
+        now[0] = timestamp
+        with pytest.raises(ExternalAPIError):
+            await fail()
+    assert breaker.state == "CLOSED"
+
+    now[0] = 140.0
+    with pytest.raises(ExternalAPIError):
+        await fail()
+    assert breaker.state == "OPEN"
+
+    now[0] = 145.0
+    with pytest.raises(ExternalAPIError, match="Circuit breaker is OPEN"):
+        await fail()
+
+    now[0] = 171.0
+    with pytest.raises(ExternalAPIError):
+        await fail()
+    assert breaker.state == "OPEN"
+
+
+def _failing(decorator, exception):
+    calls = []
+
+    @decorator
+    async def fail():
+        calls.append(1)
+        raise exception
+
+    return fail, calls
+
+
+async def test_retry_api_call_defaults_to_retry_error():
+    fail, calls = _failing(retry_api_call(max_attempts=3, wait_min=0, wait_max=0), ExternalAPIError("boom"))
+
+    with pytest.raises(RetryError):
+        await fail()
+    assert len(calls) == 3
+
+
+async def test_retry_api_call_opt_in_reraises_and_honors_stop_list():
+    strict = retry_api_call(
+        max_attempts=3, wait_min=0, wait_max=0,
+        retry_on_exceptions=(Exception,), honor_stop_on=True, reraise=True
+    )
+
+    fail, calls = _failing(strict, ExternalAPIError("boom"))
+    with pytest.raises(ExternalAPIError, match="boom"):
+        await fail()
+    assert len(calls) == 3
+
+    fail, calls = _failing(strict, RateLimitError("slow down"))
+    with pytest.raises(RateLimitError):
+        await fail()
+    assert len(calls) == 1
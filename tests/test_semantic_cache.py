@@ -0,0 +1,55 @@
+from forth_ai_underwriting.services.semantic_cache import PersistentSemanticCache, SemanticCache, simhash
+
+
+def test_get_returns_value_for_similar_embedding_with_matching_tag():
+    cache = SemanticCache(max_entries=4, similarity_threshold=0.93)
+    cache.put([1.0, 0.0, 0.1], "laid off", tag="unemployed")
+
+    assert cache.get([0.98, 0.0, 0.12], tag="unemployed") == "laid off"
+    assert cache.get([0.98, 0.0, 0.12], tag="employed") is None
+    assert cache.get([0.0, 1.0, 0.0], tag="unemployed") is None
+
+
+def test_put_evicts_least_recently_used_entry():
+    cache = SemanticCache(max_entries=2, similarity_threshold=0.99)
+    cache.put([1.0, 0.0], "a")
+    cache.put([0.0, 1.0], "b")
+    assert cache.get([1.0, 0.0]) == "a"
+
+    cache.put([1.0, 1.0], "c")
+
+    assert len(cache) == 2
+    assert cache.get([1.0, 0.0]) == "a"
+    assert cache.get([0.0, 1.0]) is None
+    assert cache.get([1.0, 1.0]) == "c"
+
+
+def test_lexical_filter_rejects_close_embeddings_of_different_text():
+    cache = SemanticCache(max_entries=4, similarity_threshold=0.9, max_lexical_distance=8)
+    base = "the client reports a cost per click increase on the campaign budget for this month"
+    cache.put([1.0, 0.0], "cpc", lexical_hash=simhash(base))
+
+    close_text = simhash(base + " again")
+    other_text = simhash("unrelated hardship description about medical bills")
+
+    assert cache.has_lexical_neighbor(close_text)
+    assert cache.get([1.0, 0.05], lexical_hash=close_text) == "cpc"
+    assert not cache.has_lexical_neighbor(other_text)
+    assert cache.get([1.0, 0.05], lexical_hash=other_text) is None
+
+
+def test_persistent_cache_reloads_entries_after_restart(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    cache = PersistentSemanticCache(path, max_entries=2, similarity_threshold=0.99)
+    cache.put([1.0, 0.0], {"answer": "a"}, tag="t")
+    cache.put([0.0, 1.0], {"answer": "b"}, tag="t")
+    cache.put([1.0, 1.0], {"answer": "c"}, tag="t")
+    cache.close()
+
+    reloaded = PersistentSemanticCache(path, max_entries=2, similarity_threshold=0.99)
+
+    assert len(reloaded) == 2
+    assert reloaded.get([1.0, 0.0], tag="t") is None
+    assert reloaded.get([0.0, 1.0], tag="t") == {"answer": "b"}
+    assert reloaded.get([1.0, 1.0], tag="t") == {"answer": "c"}
+    reloaded.close()
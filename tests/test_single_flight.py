@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+
+from forth_ai_underwriting.utils.single_flight import SingleFlight
+
+
+async def test_concurrent_calls_with_same_key_share_one_execution():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(single_flight.do("key", call) for _ in range(5)))
+
+    assert results == [1] * 5
+    assert calls == 1
+    assert len(single_flight) == 0
+    assert await single_flight.do("key", call) == 2
+
+
+async def test_exception_is_propagated_to_all_waiters():
+    single_flight = SingleFlight()
+
+    async def call():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream failed")
+
+    results = await asyncio.gather(
+        *(single_flight.do("key", call) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(single_flight) == 0